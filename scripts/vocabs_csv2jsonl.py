@@ -1,13 +1,38 @@
 #!/usr/bin/env python3
 """
 Convert vocabulary CSV files to JSONL format for efficient streaming
+
+Pass --feather to also write a zstd-compressed Arrow Feather file next to
+each JSONL file (requires pyarrow).
 """
+import codecs
 import csv
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+
+    def dumps(obj) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes"""
+        return orjson.dumps(obj)
+except ImportError:  # pragma: no cover - orjson is optional for this script
+    def dumps(obj) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - pyarrow is only needed for --feather
+    pa = None
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "docs" / "vocabularies"
 DST = ROOT / "react-app" / "public" / "data" 
@@ -21,103 +46,180 @@ VOCABS = {
     "non_proprietary": {"type": "uri_label"},
 }
 
+# Spare room reserved in the metadata line for the final entry count
+HEADER_PADDING = 32
+
+# Number of JSONL entries joined into a single write call
+WRITE_BATCH_SIZE = 1024
+
+# Separators turned into spaces when deriving a label from a URI
+_SLUG_SEPARATORS = str.maketrans({"_": " ", "-": " "})
+
+@lru_cache(maxsize=4096)
 def slug_label_from_uri(uri: str) -> str:
     """Extract label from URI"""
     if not uri:
         return ""
     u = uri.strip().rstrip("/#")
     last = u.split("/")[-1].split("#")[-1]
-    return last.replace("_", " ").replace("-", " ").strip()
-
-def read_csv_rows(path: Path):
-    """Read CSV with UTF-8 BOM support and header detection"""
-    lines = []
-    with path.open("r", encoding="utf-8-sig", newline="") as f:
-        for line in f:
-            if line.lstrip().startswith("#") or not line.strip():
-                continue
-            lines.append(line)
-    
-    if not lines:
-        return []
+    return last.translate(_SLUG_SEPARATORS).strip()
+
+# Accepted column names (normalized) for each canonical field, in priority order
+COLUMN_ALIASES = {
+    "uri": ("uri", "url", "col0"),
+    "label": ("label", "name", "col1"),
+    "equivalent": ("equivalent_uri", "equivalent", "col2"),
+    "authority": ("authority_uri", "authority", "col0"),
+    "code": ("code", "id", "col1"),
+    "license_url": ("url", "license_url", "col2"),
+}
+
+def iter_csv_rows(path: Path):
+    """
+    Stream CSV rows with UTF-8 BOM support and header detection.
     
-    # Check if first line looks like a header or data
-    first_line = lines[0].strip()
-    has_header = not ("://" in first_line)  # URIs indicate data, not headers
+    The first item yielded is the tuple of normalized column names
+    (None when the file has no header, see column_index), followed
+    by the raw row lists.
+    """
+    with path.open("rb") as f:
+        # Skip the UTF-8 BOM, if any, so the rest can be decoded as plain UTF-8
+        if f.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+            f.seek(0)
+        
+        lines = (line for line in f if line.strip() and not line.lstrip().startswith(b"#"))
+        first_line = next(lines, None)
+        if first_line is None:
+            return
+        
+        # Check if first line looks like a header or data (scanned on the raw
+        # bytes, before decoding). URIs indicate data, not headers
+        has_header = first_line.find(b"://") == -1
+        
+        reader = csv.reader(line.decode("utf-8") for line in chain([first_line], lines))
+        first_row = next(reader)
+        
+        if has_header:
+            yield tuple(h.lower().strip() for h in first_row)
+        else:
+            # No header: positional columns, whatever the width of each row
+            yield None
+            yield first_row
+        
+        yield from reader
+
+def column_index(headers: tuple) -> dict:
+    """
+    Map each canonical field to the indexes of its matching columns.
     
-    if has_header:
-        reader = csv.DictReader(lines)
-        return list(reader)
+    Without headers (None), every positional ``colN`` alias maps to column
+    N; rows shorter than that are handled by _first_value.
+    """
+    positions = {}
+    if headers is None:
+        for aliases in COLUMN_ALIASES.values():
+            for alias in aliases:
+                if alias.startswith("col"):
+                    positions[alias] = int(alias[3:])
     else:
-        # No header, use positional columns
-        rows = list(csv.reader(lines))
-        if not rows:
-            return []
-        max_len = max(len(r) for r in rows)
-        headers = [f"col{i}" for i in range(max_len)]
-        result = []
-        for r in rows:
-            # Pad short rows
-            r_padded = list(r) + [""] * (max_len - len(r))
-            result.append(dict(zip(headers, r_padded)))
-        return result
-
-def normalize_vocab_entry(vocab_name: str, row: dict) -> dict:
-    """Normalize CSV row to standard vocabulary entry"""
-    if vocab_name == "media_types":
-        # Single URI column
-        uri = None
-        for v in row.values():
-            if v and v.strip():
-                uri = v.strip()
-                break
-        return {"uri": uri} if uri else None
+        for i, header in enumerate(headers):
+            positions.setdefault(header, i)
     
-    elif vocab_name == "licenses":
-        # Handle complex license structure - use uri as primary field for consistency
-        keys = {k.lower().strip(): (v.strip() if v else "") for k, v in row.items()}
-        authority = keys.get("authority_uri") or keys.get("authority") or keys.get("col0", "")
-        code = keys.get("code") or keys.get("id") or keys.get("col1", "")
-        url = keys.get("url") or keys.get("license_url") or keys.get("col2", "")
-        
-        if not (url or code or authority):
-            return None
-            
-        entry = {}
-        # Use authority as uri for consistency with other vocabularies
-        if authority:
-            entry["uri"] = authority
-        if code:
-            entry["code"] = code
-        if url:
-            entry["url"] = url
+    col_idx = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        indexes = tuple(positions[a] for a in aliases if a in positions)
+        if indexes:
+            col_idx[field] = indexes
+    return col_idx
+
+def _first_value(row: list, indexes: tuple) -> str:
+    """Return the first non-empty stripped cell among the given indexes"""
+    for i in indexes:
+        if i < len(row):
+            value = row[i].strip()
+            if value:
+                return value
+    return ""
+
+def _normalize_uri_only(row: list, col_idx: dict) -> dict:
+    """Normalize a single-URI row (e.g. media types)"""
+    for v in row:
+        v = v.strip()
+        if v:
+            return {"uri": v}
+    return None
+
+def _normalize_licenses(row: list, col_idx: dict) -> dict:
+    """Normalize a license row - use uri as primary field for consistency"""
+    authority = _first_value(row, col_idx.get("authority", ()))
+    code = _first_value(row, col_idx.get("code", ()))
+    url = _first_value(row, col_idx.get("license_url", ()))
+    
+    if not (url or code or authority):
+        return None
         
-        # Generate label
-        entry["label"] = code or slug_label_from_uri(authority or url) or "Unknown"
-        return entry
+    entry = {}
+    # Use authority as uri for consistency with other vocabularies
+    if authority:
+        entry["uri"] = authority
+    if code:
+        entry["code"] = code
+    if url:
+        entry["url"] = url
+    
+    # Generate label
+    entry["label"] = code or slug_label_from_uri(authority or url) or "Unknown"
+    return entry
+
+def _normalize_uri_label(row: list, col_idx: dict) -> dict:
+    """Normalize a standard uri_label row"""
+    uri = _first_value(row, col_idx.get("uri", ()))
+    if not uri:
+        return None
     
+    label = _first_value(row, col_idx.get("label", ()))
+    equiv = _first_value(row, col_idx.get("equivalent", ()))
+        
+    entry = {"uri": uri}
+    if label:
+        entry["label"] = label
     else:
-        # Standard uri_label format
-        keys = {k.lower().strip(): (v.strip() if v else "") for k, v in row.items()}
-        uri = keys.get("uri") or keys.get("url") or keys.get("col0", "")
-        label = keys.get("label") or keys.get("name") or keys.get("col1", "")
-        equiv = keys.get("equivalent_uri") or keys.get("equivalent") or keys.get("col2", "")
+        entry["label"] = slug_label_from_uri(uri)
+    if equiv:
+        entry["equivalentUri"] = equiv
         
-        if not uri:
-            return None
-            
-        entry = {"uri": uri}
-        if label:
-            entry["label"] = label
-        else:
-            entry["label"] = slug_label_from_uri(uri)
-        if equiv:
-            entry["equivalentUri"] = equiv
-            
-        return entry
-
-def convert_to_jsonl(name: str, csv_path: Path, output_path: Path):
-    """Convert CSV to JSONL format for efficient streaming"""
+    return entry
+
+# Row normalizer for each vocabulary type, resolved once per file
+NORMALIZERS = {
+    "uri_only": _normalize_uri_only,
+    "licenses": _normalize_licenses,
+    "uri_label": _normalize_uri_label,
+}
+
+# Columns of the Feather file for each vocabulary type: (name, holds URIs).
+# Optional entry keys are nullable columns, so they are kept even if the first rows lack them
+FEATHER_COLUMNS = {
+    "uri_only": (("uri", True),),
+    "uri_label": (("uri", True), ("label", False), ("equivalentUri", True)),
+    "licenses": (("uri", True), ("code", False), ("url", True), ("label", False)),
+}
+
+def feather_schema(vocab_type: str):
+    """Arrow schema of a vocabulary type, with dictionary-encoded URI columns"""
+    uri_type = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        pa.field(name, uri_type if is_uri else pa.string())
+        for name, is_uri in FEATHER_COLUMNS[vocab_type]
+    ])
+
+def write_feather(entries: list, output_path: Path, vocab_type: str) -> None:
+    """Write vocabulary entries as a columnar Arrow Feather file"""
+    table = pa.Table.from_pylist(entries, schema=feather_schema(vocab_type))
+    feather.write_feather(table, output_path, compression="zstd")
+
+def convert_to_jsonl(name: str, csv_path: Path, output_path: Path, feather_path: Path = None):
+    """Convert CSV to JSONL format for efficient streaming, optionally also to Feather"""
     metadata = {
         "source": str(csv_path.relative_to(ROOT)),
         "generated": datetime.utcnow().isoformat(timespec="seconds") + "Z",
@@ -127,23 +229,38 @@ def convert_to_jsonl(name: str, csv_path: Path, output_path: Path):
     }
     
     count = 0
-    with output_path.open('w', encoding='utf-8') as jsonl_file:
-        # First line: metadata
-        jsonl_file.write(json.dumps(metadata, ensure_ascii=False) + '\n')
+    with output_path.open('w+b', buffering=1 << 20) as jsonl_file:
+        # First line: metadata with a placeholder count, padded so the final
+        # count can be written in place once all rows are streamed
+        header = dumps({**metadata, "count": 0})
+        header_len = len(header) + HEADER_PADDING
+        jsonl_file.write(header.ljust(header_len) + b'\n')
         
-        # Process CSV rows
-        rows = read_csv_rows(csv_path)
-        for row in rows:
-            entry = normalize_vocab_entry(name, row)
-            if entry:
-                jsonl_file.write(json.dumps(entry, ensure_ascii=False) + '\n')
-                count += 1
+        # Process CSV rows, resolving column positions once per file
+        rows = iter_csv_rows(csv_path)
+        col_idx = column_index(next(rows, ()))
+        normalize = NORMALIZERS[VOCABS[name]["type"]]
+        entries = filter(None, (normalize(row, col_idx) for row in rows))
+        collected = [] if feather_path else None
+        batch = []
+        for entry in entries:
+            batch.append(dumps(entry))
+            count += 1
+            if collected is not None:
+                collected.append(entry)
+            if len(batch) >= WRITE_BATCH_SIZE:
+                jsonl_file.write(b'\n'.join(batch) + b'\n')
+                batch.clear()
+        if batch:
+            jsonl_file.write(b'\n'.join(batch) + b'\n')
+        
+        # Update metadata with final count
+        metadata["count"] = count
+        jsonl_file.seek(0)
+        jsonl_file.write(dumps(metadata).ljust(header_len))
     
-    # Update metadata with final count
-    lines = output_path.read_text(encoding='utf-8').splitlines()
-    metadata["count"] = count
-    lines[0] = json.dumps(metadata, ensure_ascii=False)
-    output_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    if feather_path:
+        write_feather(collected, feather_path, VOCABS[name]["type"])
     
     return count
 
@@ -152,19 +269,36 @@ def main():
         print(f"ERROR: Source folder not found: {SRC}", file=sys.stderr)
         sys.exit(1)
     
+    emit_feather = "--feather" in sys.argv[1:]
+    if emit_feather and pa is None:
+        print("ERROR: --feather requires pyarrow to be installed", file=sys.stderr)
+        sys.exit(1)
+    
     DST.mkdir(parents=True, exist_ok=True)
     total = 0
     
+    jobs = {}
     for name in VOCABS.keys():
         csv_file = SRC / f"{name}.csv"
         if not csv_file.exists():
             print(f"WARNING: Missing CSV: {csv_file}")
             continue
-            
-        jsonl_file = DST / f"{name}.jsonl"
-        count = convert_to_jsonl(name, csv_file, jsonl_file)
-        print(f"✔ {name}: {count} entries -> {jsonl_file.relative_to(ROOT)}")
-        total += count
+        feather_file = DST / f"{name}.feather" if emit_feather else None
+        jobs[name] = (csv_file, DST / f"{name}.jsonl", feather_file)
+    
+    # Vocabularies are independent, convert them in parallel
+    max_workers = max(1, min(len(jobs), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(convert_to_jsonl, name, *paths): name
+            for name, paths in jobs.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            count = future.result()
+            jsonl_file = jobs[name][1]
+            print(f"✔ {name}: {count} entries -> {jsonl_file.relative_to(ROOT)}")
+            total += count
     
     print(f"Done. Total entries: {total}")
 
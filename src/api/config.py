@@ -3,6 +3,10 @@ Configuration module for the metadata quality assessment tool.
 This module contains all constants and configuration parameters used throughout the application.
 """
 import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Set, Any
 from .models import DimensionType, Rating
 
@@ -10,12 +14,23 @@ from .models import DimensionType, Rating
 # SSL verification configuration
 SSL_VERIFY = os.environ.get('SSL_VERIFY', 'True').lower() in ['true', '1', 'yes']
 ALLOW_INSECURE_URLS = os.environ.get('ALLOW_INSECURE_URLS', 'True').lower() in ['true', '1', 'yes']
+# Máximo de métricas evaluadas simultáneamente en calculate_metrics (1 = en serie)
+METRIC_CHECK_WORKERS = int(os.environ.get('METRIC_CHECK_WORKERS', '8'))
+# Usar el store Oxigraph (paquete opcional oxrdflib) para los grafos de datos si está instalado
+USE_OXIGRAPH = os.environ.get('USE_OXIGRAPH', 'True').lower() in ['true', '1', 'yes']
 
 # Base path for local resources
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DOCS_DIR = os.path.join(os.path.dirname(BASE_DIR), "docs")
 SHACL_DIR = os.path.join(DOCS_DIR, "shacl")
 VOCAB_DIR = os.path.join(DOCS_DIR, "vocabularies")
+_SHACL_ROOT = Path(SHACL_DIR)
+
+# Datos persistentes (informes de calidad). En Docker DATA_DIR=/app/data, montado como volumen
+DATA_DIR = os.environ.get('DATA_DIR', '.')
+DB_PATH = os.environ.get('MQA_DB_PATH', os.path.join(DATA_DIR, "mqa_db.sqlite"))
+# Base de datos TinyDB anterior al repositorio SQLite; se importa una vez al arrancar
+LEGACY_TINYDB_PATH = os.path.join(DATA_DIR, "mqa_db.json")
 
 # Maximum scores per dimension according to MQA methodology
 MAX_SCORES = {
@@ -27,7 +42,7 @@ MAX_SCORES = {
 }
 
 # Umbrales de puntuación por perfil
-RATING_THRESHOLDS_BY_PROFILE = {
+RATING_THRESHOLDS_BY_PROFILE = MappingProxyType({
     "dcat_ap": {
         "excellent": 351,  # Manteniendo los umbrales originales para DCAT-AP
         "good": 221,
@@ -43,7 +58,7 @@ RATING_THRESHOLDS_BY_PROFILE = {
         "good": 166,
         "sufficient": 91
     }
-}
+})
 
 # Mantenemos RATING_THRESHOLDS para compatibilidad con código existente
 RATING_THRESHOLDS = RATING_THRESHOLDS_BY_PROFILE["dcat_ap_es"]
@@ -60,115 +75,64 @@ DCAT_AP_VERSION = "2.1.1"  # Default version to use (DCAT-AP-ES is based on DCAT
 DCAT_AP_ES_VERSION = "1.0.0"  # Default version to use
 NTI_RISP_VERSION = "1.0.0"  # Default version to use
 
+# DCAT-AP SHACL files, by file stem
+_DCAT_AP_DIR = _SHACL_ROOT / "dcat-ap" / DCAT_AP_VERSION
+_DCAT_AP_BASE_URL = f"https://raw.githubusercontent.com/SEMICeu/DCAT-AP/master/releases/{DCAT_AP_VERSION}/"
+_DCAT_AP_LEVEL_1_STEMS = ("shapes", "imports", "range", "deprecateduris")
+_DCAT_AP_LEVEL_2_STEMS = _DCAT_AP_LEVEL_1_STEMS + ("mdr-vocabularies.shape", "mdr_imports")
+_DCAT_AP_LEVEL_3_STEMS = _DCAT_AP_LEVEL_2_STEMS + ("shapes_recommended",)
+_DCAT_AP_FILES = {
+    stem: f"dcat-ap_{DCAT_AP_VERSION}_shacl_{stem}.ttl" for stem in _DCAT_AP_LEVEL_3_STEMS
+}
+_DCAT_AP_PATHS = {
+    stem: _DCAT_AP_DIR / name for stem, name in _DCAT_AP_FILES.items()
+}
+
 # DCAT-AP SHACL files by level - actualizado para incluir todos los archivos
+# Rutas resueltas una sola vez e inmutables (tuplas de Path)
 DCAT_AP_SHACL_FILES = {
-    SHACLLevel.LEVEL_1: [
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_shapes.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_imports.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_range.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_deprecateduris.ttl")
-    ],
-    SHACLLevel.LEVEL_2: [
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_shapes.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_imports.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_range.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_deprecateduris.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_mdr-vocabularies.shape.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_mdr_imports.ttl")
-    ],
-    SHACLLevel.LEVEL_3: [
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_shapes.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_imports.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_range.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_deprecateduris.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_mdr-vocabularies.shape.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_mdr_imports.ttl"),
-        os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_shapes_recommended.ttl")
-    ]
+    SHACLLevel.LEVEL_1: tuple(_DCAT_AP_PATHS[stem] for stem in _DCAT_AP_LEVEL_1_STEMS),
+    SHACLLevel.LEVEL_2: tuple(_DCAT_AP_PATHS[stem] for stem in _DCAT_AP_LEVEL_2_STEMS),
+    SHACLLevel.LEVEL_3: tuple(_DCAT_AP_PATHS[stem] for stem in _DCAT_AP_LEVEL_3_STEMS),
 }
 
 # DCAT-AP-ES SHACL files (all are validated together)
-DCAT_AP_ES_SHACL_FILES = [
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_catalog_shape.ttl"),
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_common_shapes.ttl"),
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_dataservice_shape.ttl"),
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_dataset_shape.ttl"),
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_distribution_shape.ttl"),
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_mdr-vocabularies.shape.ttl")
-]
+_DCAT_AP_ES_DIR = _SHACL_ROOT / "dcat-ap-es" / DCAT_AP_ES_VERSION
+_DCAT_AP_ES_BASE_URL = f"https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/{DCAT_AP_ES_VERSION}/"
+_DCAT_AP_ES_FILES = (
+    "shacl_catalog_shape.ttl",
+    "shacl_common_shapes.ttl",
+    "shacl_dataservice_shape.ttl",
+    "shacl_dataset_shape.ttl",
+    "shacl_distribution_shape.ttl",
+    "shacl_mdr-vocabularies.shape.ttl",
+)
+DCAT_AP_ES_SHACL_FILES = tuple(_DCAT_AP_ES_DIR / name for name in _DCAT_AP_ES_FILES)
 
 # High Value Dataset SHACL files
-DCAT_AP_ES_HVD_SHACL_FILES = [
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "hvd", "shacl_common_hvd_shapes.ttl"),
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "hvd", "shacl_dataservice_hvd_shape.ttl"),
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "hvd", "shacl_dataset_hvd_shape.ttl"),
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "hvd", "shacl_distribution_hvd_shape.ttl")
-]
+_DCAT_AP_ES_HVD_FILES = (
+    "shacl_common_hvd_shapes.ttl",
+    "shacl_dataservice_hvd_shape.ttl",
+    "shacl_dataset_hvd_shape.ttl",
+    "shacl_distribution_hvd_shape.ttl",
+)
+DCAT_AP_ES_HVD_SHACL_FILES = tuple(_DCAT_AP_ES_DIR / "hvd" / name for name in _DCAT_AP_ES_HVD_FILES)
 
-NTI_RISP_SHACL_FILES = [
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_catalog_shape.ttl"),
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_common_shapes.ttl"),
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_dataservice_shape.ttl"),
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_dataset_shape.ttl"),
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_distribution_shape.ttl"),
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_mdr-vocabularies.shape.ttl")
-]
+_NTI_RISP_DIR = _SHACL_ROOT / "nti-risp" / NTI_RISP_VERSION
+_NTI_RISP_BASE_URL = f"https://raw.githubusercontent.com/datosgobes/NTI-RISP/main/shacl/{NTI_RISP_VERSION}/"
+_NTI_RISP_FILES = _DCAT_AP_ES_FILES  # Same file layout as DCAT-AP-ES
+NTI_RISP_SHACL_FILES = tuple(_NTI_RISP_DIR / name for name in _NTI_RISP_FILES)
 
 # URLs para cada archivo SHACL
 SHACL_REMOTE_URLS = {
     # DCAT-AP
-    os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_shapes.ttl"):
-        f"https://raw.githubusercontent.com/SEMICeu/DCAT-AP/master/releases/{DCAT_AP_VERSION}/dcat-ap_{DCAT_AP_VERSION}_shacl_shapes.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_imports.ttl"):
-        f"https://raw.githubusercontent.com/SEMICeu/DCAT-AP/master/releases/{DCAT_AP_VERSION}/dcat-ap_{DCAT_AP_VERSION}_shacl_imports.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_range.ttl"):
-        f"https://raw.githubusercontent.com/SEMICeu/DCAT-AP/master/releases/{DCAT_AP_VERSION}/dcat-ap_{DCAT_AP_VERSION}_shacl_range.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_deprecateduris.ttl"):
-        f"https://raw.githubusercontent.com/SEMICeu/DCAT-AP/master/releases/{DCAT_AP_VERSION}/dcat-ap_{DCAT_AP_VERSION}_shacl_deprecateduris.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_mdr-vocabularies.shape.ttl"):
-        f"https://raw.githubusercontent.com/SEMICeu/DCAT-AP/master/releases/{DCAT_AP_VERSION}/dcat-ap_{DCAT_AP_VERSION}_shacl_mdr-vocabularies.shape.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_mdr_imports.ttl"):
-        f"https://raw.githubusercontent.com/SEMICeu/DCAT-AP/master/releases/{DCAT_AP_VERSION}/dcat-ap_{DCAT_AP_VERSION}_shacl_mdr_imports.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap", DCAT_AP_VERSION, f"dcat-ap_{DCAT_AP_VERSION}_shacl_shapes_recommended.ttl"):
-        f"https://raw.githubusercontent.com/SEMICeu/DCAT-AP/master/releases/{DCAT_AP_VERSION}/dcat-ap_{DCAT_AP_VERSION}_shacl_shapes_recommended.ttl",
-        
+    **{_DCAT_AP_PATHS[stem]: _DCAT_AP_BASE_URL + name for stem, name in _DCAT_AP_FILES.items()},
     # DCAT-AP-ES
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_catalog_shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/{DCAT_AP_ES_VERSION}/shacl_catalog_shape.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_common_shapes.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/{DCAT_AP_ES_VERSION}/shacl_common_shapes.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_dataservice_shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/{DCAT_AP_ES_VERSION}/shacl_dataservice_shape.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_dataset_shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/{DCAT_AP_ES_VERSION}/shacl_dataset_shape.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_distribution_shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/{DCAT_AP_ES_VERSION}/shacl_distribution_shape.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "shacl_mdr-vocabularies.shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/{DCAT_AP_ES_VERSION}/shacl_mdr-vocabularies.shape.ttl",
-    
+    **{path: _DCAT_AP_ES_BASE_URL + name for path, name in zip(DCAT_AP_ES_SHACL_FILES, _DCAT_AP_ES_FILES)},
     # DCAT-AP-ES HVD
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "hvd", "shacl_common_hvd_shapes.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/{DCAT_AP_ES_VERSION}/hvd/shacl_common_hvd_shapes.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "hvd", "shacl_dataservice_hvd_shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/{DCAT_AP_ES_VERSION}/hvd/shacl_dataservice_hvd_shape.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "hvd", "shacl_dataset_hvd_shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/{DCAT_AP_ES_VERSION}/hvd/shacl_dataset_hvd_shape.ttl",
-    os.path.join(SHACL_DIR, "dcat-ap-es", DCAT_AP_ES_VERSION, "hvd", "shacl_distribution_hvd_shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/{DCAT_AP_ES_VERSION}/hvd/shacl_distribution_hvd_shape.ttl",
-    
+    **{path: f"{_DCAT_AP_ES_BASE_URL}hvd/{name}" for path, name in zip(DCAT_AP_ES_HVD_SHACL_FILES, _DCAT_AP_ES_HVD_FILES)},
     # NTI-RISP
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_catalog_shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/NTI-RISP/main/shacl/{NTI_RISP_VERSION}/shacl_catalog_shape.ttl",
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_common_shapes.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/NTI-RISP/main/shacl/{NTI_RISP_VERSION}/shacl_common_shapes.ttl",
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_dataservice_shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/NTI-RISP/main/shacl/{NTI_RISP_VERSION}/shacl_dataservice_shape.ttl",
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_dataset_shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/NTI-RISP/main/shacl/{NTI_RISP_VERSION}/shacl_dataset_shape.ttl",
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_distribution_shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/NTI-RISP/main/shacl/{NTI_RISP_VERSION}/shacl_distribution_shape.ttl",
-    os.path.join(SHACL_DIR, "nti-risp", NTI_RISP_VERSION, "shacl_mdr-vocabularies.shape.ttl"):
-        f"https://raw.githubusercontent.com/datosgobes/NTI-RISP/main/shacl/{NTI_RISP_VERSION}/shacl_mdr-vocabularies.shape.ttl",
+    **{path: _NTI_RISP_BASE_URL + name for path, name in zip(NTI_RISP_SHACL_FILES, _NTI_RISP_FILES)},
 }
 
 # Configuración para la actualización de los archivos SHACL
@@ -178,6 +142,28 @@ SHACL_UPDATE_CONFIG = {
     "timeout": 10,              # Timeout para las solicitudes HTTP en segundos
 }
 
+# Motor de validación SHACL: "pyshacl" (por defecto) o "jena" (CLI `shacl` de Apache Jena,
+# si no está disponible se usa pyshacl)
+SHACL_VALIDATION_CONFIG = {
+    "backend": os.environ.get('SHACL_BACKEND', 'pyshacl').lower(),
+    "jena_command": os.environ.get('JENA_SHACL_CMD', 'shacl'),
+    "timeout": 120,             # Timeout del proceso de Jena en segundos
+    "results_cache_size": 256,  # Resultados de validación recordados (por grafo y formas SHACL)
+}
+
+# Caché persistente del estado de las URL comprobadas (accessURL/downloadURL)
+URL_STATUS_CACHE_CONFIG = {
+    "path": os.environ.get('URL_STATUS_CACHE_PATH', os.path.join(tempfile.gettempdir(), "mqa_url_cache.sqlite")),
+    "ttl": 24 * 3600,           # URLs accesibles: se vuelven a comprobar tras 24 horas
+    "negative_ttl": 3600,       # URLs con error: tras 1 hora, por si el fallo era transitorio
+}
+
+# Informes de contenido directo recordados por hash del contenido (envíos repetidos, p. ej. en CI)
+CONTENT_REPORT_CACHE_CONFIG = {
+    "size": 128,                # Informes recordados como máximo
+    "ttl": 3600,                # Como la comprobación de URL con error: pasado ese tiempo se recalcula
+}
+
 # MQA vocabularies
 MQA_VOCABS = {
     # machine-readable formats: https://gitlab.com/dataeuropa/vocabularies/-/blob/master/piveau-machine-readable-format.rdf
@@ -196,7 +182,7 @@ MQA_VOCABS = {
 
 
 # Fallback URLs for SHACL shapes if local files are not available
-DCAT_AP_SHAPES_URL = f"https://raw.githubusercontent.com/SEMICeu/DCAT-AP/master/releases/{DCAT_AP_VERSION}/dcat-ap_{DCAT_AP_VERSION}_shacl_shapes.ttl"
+DCAT_AP_SHAPES_URL = _DCAT_AP_BASE_URL + _DCAT_AP_FILES["shapes"]
 DCAT_AP_ES_SHAPES_URL = "https://raw.githubusercontent.com/datosgobes/DCAT-AP-ES/main/shacl/1.0.0/shacl_common_shapes.ttl"
 NTI_RISP_SHAPES_URL = "https://raw.githubusercontent.com/datosgobes/NTI-RISP/main/shacl/1.0.0/shacl_common_shapes.ttl"
 
@@ -239,92 +225,138 @@ DEFAULT_METRICS = [
     {"id": "dct_modified", "dimension": DimensionType.CONTEXTUALITY, "weight": 5}
 ]
 
+@dataclass(frozen=True)
+class Metric:
+    """Immutable metric definition (identifier, dimension and weight)."""
+    __slots__ = ("id", "dimension", "weight")
+    id: str
+    dimension: str
+    weight: int
+
+    def __getitem__(self, key: str) -> Any:
+        """Allow dict-style access (``metric["id"]``) for backwards compatibility."""
+        return getattr(self, key)
+
 # Métricas comunes para todos los perfiles (195)
-COMMON_METRICS = [
+COMMON_METRICS = (
     # Findability: 30 + 30 + 20 + 20 = 100
-    {"id": "dcat_keyword", "dimension": "findability", "weight": 30},
-    {"id": "dcat_theme", "dimension": "findability", "weight": 30},
-    {"id": "dct_spatial", "dimension": "findability", "weight": 20},
-    {"id": "dct_temporal", "dimension": "findability", "weight": 20},
+    Metric("dcat_keyword", "findability", 30),
+    Metric("dcat_theme", "findability", 30),
+    Metric("dct_spatial", "findability", 20),
+    Metric("dct_temporal", "findability", 20),
     
     # Accessibility: 50
-    {"id": "dcat_accessURL_status", "dimension": "accessibility", "weight": 50},
+    Metric("dcat_accessURL_status", "accessibility", 50),
     
     # Interoperability: 20 + 10 = 30
-    {"id": "dct_format", "dimension": "interoperability", "weight": 20},
-    {"id": "dcat_mediaType", "dimension": "interoperability", "weight": 10},
+    Metric("dct_format", "interoperability", 20),
+    Metric("dcat_mediaType", "interoperability", 10),
     
     # Contextuality: 5 + 5 + 5 = 15
-    {"id": "dcat_byteSize", "dimension": "contextuality", "weight": 5},
-    {"id": "dct_issued", "dimension": "contextuality", "weight": 5},
-    {"id": "dct_modified", "dimension": "contextuality", "weight": 5}
-]
+    Metric("dcat_byteSize", "contextuality", 5),
+    Metric("dct_issued", "contextuality", 5),
+    Metric("dct_modified", "contextuality", 5)
+)
 
 # DCAT-AP y DCAT-AP-ES metrics (180)
-DCAT_COMMON_METRICS = [
+DCAT_COMMON_METRICS = (
     # Accessibility: 20 + 30 = 50
-    {"id": "dcat_downloadURL", "dimension": "accessibility", "weight": 20},
-    {"id": "dcat_downloadURL_status", "dimension": "accessibility", "weight": 30},
+    Metric("dcat_downloadURL", "accessibility", 20),
+    Metric("dcat_downloadURL_status", "accessibility", 30),
     
     # Interoperability: 5 + 5 + 20 + 20 = 50
-    {"id": "dct_format_vocabulary", "dimension": "interoperability", "weight": 5},
-    {"id": "dct_mediaType_vocabulary", "dimension": "interoperability", "weight": 5},
-    {"id": "dct_format_nonproprietary", "dimension": "interoperability", "weight": 20},
-    {"id": "dct_format_machinereadable", "dimension": "interoperability", "weight": 20},  
+    Metric("dct_format_vocabulary", "interoperability", 5),
+    Metric("dct_mediaType_vocabulary", "interoperability", 5),
+    Metric("dct_format_nonproprietary", "interoperability", 20),
+    Metric("dct_format_machinereadable", "interoperability", 20),  
 
     # Reusability: 20 + 10 + 10 + 5 + 20 + 10 = 75
-    {"id": "dct_license", "dimension": "reusability", "weight": 20},
-    {"id": "dct_license_vocabulary", "dimension": "reusability", "weight": 10},
-    {"id": "dct_accessRights", "dimension": "reusability", "weight": 10},
-    {"id": "dct_accessRights_vocabulary", "dimension": "reusability", "weight": 5},
-    {"id": "dcat_contactPoint", "dimension": "reusability", "weight": 20},
-    {"id": "dct_publisher", "dimension": "reusability", "weight": 10},
+    Metric("dct_license", "reusability", 20),
+    Metric("dct_license_vocabulary", "reusability", 10),
+    Metric("dct_accessRights", "reusability", 10),
+    Metric("dct_accessRights_vocabulary", "reusability", 5),
+    Metric("dcat_contactPoint", "reusability", 20),
+    Metric("dct_publisher", "reusability", 10),
     
     # Contextuality: 5
-    {"id": "dct_rights", "dimension": "contextuality", "weight": 5}
-]
+    Metric("dct_rights", "contextuality", 5)
+)
 
 # DCAT-AP-ES specific metrics (405)
-DCAT_AP_ES_SPECIFIC_METRICS = [
-    {"id": "dcat_ap_es_compliance", "dimension": "interoperability", "weight": 30}
-]
+DCAT_AP_ES_SPECIFIC_METRICS = (
+    Metric("dcat_ap_es_compliance", "interoperability", 30),
+)
 
 # DCAT-AP specific metrics (405)
-DCAT_AP_SPECIFIC_METRICS = [
-    {"id": "dcat_ap_compliance", "dimension": "interoperability", "weight": 30}
-]
+DCAT_AP_SPECIFIC_METRICS = (
+    Metric("dcat_ap_compliance", "interoperability", 30),
+)
 
 # Métricas específicas de NTI-RISP (195 + 75 + 40 = 310)
-NTI_RISP_SPECIFIC_METRICS = [
+NTI_RISP_SPECIFIC_METRICS = (
     # Interoperability NTI-RISP: 5 + 20 + 20 + 30 = 75
-    {"id": "dct_format_vocabulary_nti_risp", "dimension": "interoperability", "weight": 5},
-    {"id": "dct_format_nonproprietary", "dimension": "interoperability", "weight": 20},
-    {"id": "dct_format_machinereadable", "dimension": "interoperability", "weight": 20},
-    {"id": "nti_risp_compliance", "dimension": "interoperability", "weight": 30},
+    Metric("dct_format_vocabulary_nti_risp", "interoperability", 5),
+    Metric("dct_format_nonproprietary", "interoperability", 20),
+    Metric("dct_format_machinereadable", "interoperability", 20),
+    Metric("nti_risp_compliance", "interoperability", 30),
     
     # Reusability NTI-RISP: 20 + 10 + 10 = 40
-    {"id": "dct_license", "dimension": "reusability", "weight": 20},
-    {"id": "dct_license_vocabulary", "dimension": "reusability", "weight": 10},
-    {"id": "dct_publisher", "dimension": "reusability", "weight": 10}    
-]
+    Metric("dct_license", "reusability", 20),
+    Metric("dct_license_vocabulary", "reusability", 10),
+    Metric("dct_publisher", "reusability", 10)    
+)
 
 # Definir las métricas para cada perfil
-METRICS_BY_PROFILE = {
+METRICS_BY_PROFILE = MappingProxyType({
     "dcat_ap": COMMON_METRICS + DCAT_COMMON_METRICS + DCAT_AP_SPECIFIC_METRICS,
     "dcat_ap_es": COMMON_METRICS + DCAT_COMMON_METRICS + DCAT_AP_ES_SPECIFIC_METRICS,
     "nti_risp": COMMON_METRICS + NTI_RISP_SPECIFIC_METRICS
-}
+})
 
 # Stalish default metrics compatible with DCAT-AP-ES
 DEFAULT_METRICS = METRICS_BY_PROFILE["dcat_ap_es"]
 
-MAX_SCORES = {
+# Índices precalculados por perfil: métrica por id, métricas por dimensión y peso total por dimensión
+METRICS_BY_ID_BY_PROFILE = MappingProxyType({
+    profile: MappingProxyType({metric.id: metric for metric in metrics})
+    for profile, metrics in METRICS_BY_PROFILE.items()
+})
+
+METRICS_BY_DIMENSION_BY_PROFILE = MappingProxyType({
+    profile: MappingProxyType({
+        dimension: tuple(metric for metric in metrics if metric.dimension == dimension)
+        for dimension in DimensionType
+    })
+    for profile, metrics in METRICS_BY_PROFILE.items()
+})
+
+DIMENSION_WEIGHT_SUM_BY_PROFILE = MappingProxyType({
+    profile: MappingProxyType({
+        dimension: sum(metric.weight for metric in metrics)
+        for dimension, metrics in metrics_by_dimension.items()
+    })
+    for profile, metrics_by_dimension in METRICS_BY_DIMENSION_BY_PROFILE.items()
+})
+
+# Índices del perfil por defecto (DCAT-AP-ES)
+METRICS_BY_ID = METRICS_BY_ID_BY_PROFILE["dcat_ap_es"]
+METRICS_BY_DIMENSION = METRICS_BY_DIMENSION_BY_PROFILE["dcat_ap_es"]
+DIMENSION_WEIGHT_SUM = DIMENSION_WEIGHT_SUM_BY_PROFILE["dcat_ap_es"]
+
+# URN de cada métrica conocida (todos los perfiles), usado en la salida JSON-LD
+METRIC_URN = MappingProxyType({
+    metric_id: "urn:mqa:metric:" + metric_id
+    for metrics_by_id in METRICS_BY_ID_BY_PROFILE.values()
+    for metric_id in metrics_by_id
+})
+
+MAX_SCORES = MappingProxyType({
     "dcat_ap": 405,
     "dcat_ap_es": 405,
     "nti_risp": 310
-}
+})
 
-DIMENSION_MAX_SCORES = {
+DIMENSION_MAX_SCORES = MappingProxyType({
     "dcat_ap": {
         "findability": 100,
         "accessibility": 100,
@@ -346,9 +378,9 @@ DIMENSION_MAX_SCORES = {
         "reusability": 40,
         "contextuality": 15
     }
-}
+})
 
-METRIC_LABELS = {
+METRIC_LABELS = MappingProxyType({
     # Findability metrics
     "dcat_keyword": {
         "en": "Keywords",
@@ -464,4 +496,4 @@ METRIC_LABELS = {
         "en": "Format Vocabulary (NTI-RISP)",
         "es": "Vocabulario de formato (NTI-RISP)"
     }
-}
\ No newline at end of file
+})
@@ -3,13 +3,61 @@ Converter module for data format transformations.
 This module provides functions to convert between different data formats,
 such as JSON-LD with Data Quality Vocabulary (DQV).
 """
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import urllib.parse
+from functools import lru_cache
 from datetime import datetime
+import orjson
 from .config import (
     METRIC_LABELS,
+    METRIC_URN,
 )
 
+# Flat (metric_id, lang) -> label lookup table
+_LABEL_LUT: Dict[Tuple[str, str], str] = {
+    (metric_id, lang): label
+    for metric_id, labels in METRIC_LABELS.items()
+    for lang, label in labels.items()
+}
+
+# JSON-LD context with the relevant vocabularies (shared, read-only)
+_CONTEXT = {
+    "dqv": "http://www.w3.org/ns/dqv#",
+    "dcat": "http://www.w3.org/ns/dcat#",
+    "dcterms": "http://purl.org/dc/terms/",
+    "prov": "http://www.w3.org/ns/prov#",
+    "foaf": "http://xmlns.com/foaf/0.1/",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+    "oa": "http://www.w3.org/ns/oa#",
+    "skos": "http://www.w3.org/2004/02/skos/core#",
+    "schema": "http://schema.org/",
+    "fair": "https://w3id.org/fair/principles/terms/"
+}
+
+# Map our dimensions to DQV dimensions
+_DIMENSION_MAP = {
+    "findability": "fair:F",
+    "accessibility": "fair:A",
+    "interoperability": "fair:I",
+    "reusability": "fair:R",
+    "contextuality": "dqv:contextualQuality"
+}
+
+# Shared, read-only DQV dimension nodes referenced from every measurement
+_DIMENSION_REFS = {
+    key: {"@id": dqv_id, "@type": "dqv:Dimension"}
+    for key, dqv_id in _DIMENSION_MAP.items()
+}
+_DIMENSION_METRICS = {
+    key: {"@id": dqv_id, "@type": "dqv:Dimension", "skos:prefLabel": key.capitalize()}
+    for key, dqv_id in _DIMENSION_MAP.items()
+}
+
+@lru_cache(maxsize=2048)
+def _safe_urn(url: str) -> str:
+    """Percent-encode a source URL for use inside a URN (cached per URL)."""
+    return urllib.parse.quote_from_bytes(url.encode("utf-8"), safe=b"")
+
 def get_metric_label(metric_id: str, lang: str = "en") -> str:
     """
     Get the localized label for a metric.
@@ -21,9 +69,7 @@ def get_metric_label(metric_id: str, lang: str = "en") -> str:
     Returns:
         Localized label or the original ID if no translation is found
     """
-    if metric_id in METRIC_LABELS and lang in METRIC_LABELS[metric_id]:
-        return METRIC_LABELS[metric_id][lang]
-    return metric_id.replace("_", " ").capitalize()
+    return _LABEL_LUT.get((metric_id, lang)) or metric_id.replace("_", " ").capitalize()
 
 def convert_to_jsonld_dqv(report: Dict[str, Any], lang: str = "en") -> Dict[str, Any]:
     """
@@ -36,39 +82,14 @@ def convert_to_jsonld_dqv(report: Dict[str, Any], lang: str = "en") -> Dict[str,
     Returns:
         JSON-LD representation of the quality report
     """
-    # Create a JSON-LD context with the relevant vocabularies
-    context = {
-        "@context": {
-            "dqv": "http://www.w3.org/ns/dqv#",
-            "dcat": "http://www.w3.org/ns/dcat#",
-            "dcterms": "http://purl.org/dc/terms/",
-            "prov": "http://www.w3.org/ns/prov#",
-            "foaf": "http://xmlns.com/foaf/0.1/",
-            "xsd": "http://www.w3.org/2001/XMLSchema#",
-            "oa": "http://www.w3.org/ns/oa#",
-            "skos": "http://www.w3.org/2004/02/skos/core#",
-            "schema": "http://schema.org/",
-            "fair": "https://w3id.org/fair/principles/terms/"
-        }
-    }
-    
     # Create a unique identifier for the quality measurement
     # Replace problematic URL characters with hyphens
-    safe_url = urllib.parse.quote(report['source'], safe='')
+    safe_url = _safe_urn(report['source'])
     measurement_id = f"urn:mqa:measurement:{safe_url}-{report['created']}"
     
-    # Map our dimensions to DQV dimensions
-    dimension_map = {
-        "findability": "fair:F",
-        "accessibility": "fair:A",
-        "interoperability": "fair:I",
-        "reusability": "fair:R",
-        "contextuality": "dqv:contextualQuality"
-    }
-    
     # Create the base JSON-LD structure
     jsonld = {
-        "@context": context["@context"],
+        "@context": _CONTEXT,
         "@id": measurement_id,
         "@type": "dqv:QualityMeasurement",
         "dcterms:created": f"{report['created']}T00:00:00Z",
@@ -94,16 +115,12 @@ def convert_to_jsonld_dqv(report: Dict[str, Any], lang: str = "en") -> Dict[str,
     
     # Add dimension measurements
     for dim_key, dim_value in report['dimensions'].items():
-        dimension_id = f"{measurement_id}-{dim_key}"
+        dimension_id = measurement_id + "-" + dim_key
         dimension_measurement = {
             "@id": dimension_id,
             "@type": "dqv:QualityMeasurement",
             "dqv:value": dim_value,
-            "dqv:isMeasurementOf": {
-                "@id": dimension_map[dim_key],
-                "@type": "dqv:Dimension",
-                "skos:prefLabel": dim_key.capitalize()
-            }
+            "dqv:isMeasurementOf": _DIMENSION_METRICS[dim_key]
         }
         jsonld["dqv:hasQualityMeasurement"].append(dimension_measurement)
     
@@ -116,13 +133,10 @@ def convert_to_jsonld_dqv(report: Dict[str, Any], lang: str = "en") -> Dict[str,
                 "@type": "dqv:QualityMeasurement",
                 "dqv:value": metric['points'],
                 "dqv:isMeasurementOf": {
-                    "@id": f"urn:mqa:metric:{metric['id']}",
+                    "@id": METRIC_URN.get(metric_id) or "urn:mqa:metric:" + metric_id,
                     "@type": "dqv:Metric",
                     "skos:prefLabel": get_metric_label(metric_id, lang),
-                    "dqv:inDimension": {
-                        "@id": dimension_map[metric['dimension']],
-                        "@type": "dqv:Dimension"
-                    }
+                    "dqv:inDimension": _DIMENSION_REFS[metric['dimension']]
                 },
                 "dqv:computedOn": {
                     "@id": report['source'],
@@ -134,4 +148,79 @@ def convert_to_jsonld_dqv(report: Dict[str, Any], lang: str = "en") -> Dict[str,
             }
             jsonld["dqv:hasQualityMeasurement"].append(metric_measurement)
     
-    return jsonld
\ No newline at end of file
+    return jsonld
+
+# Pre-encoded JSON scaffolding for render_jsonld_dqv (same shape and key order as convert_to_jsonld_dqv)
+_JSONLD_HEAD = (
+    b'{"@context":' + orjson.dumps(_CONTEXT) +
+    b',"@id":%s,"@type":"dqv:QualityMeasurement","dcterms:created":%s,"dcterms:title":%s,'
+    b'"dqv:computedOn":%s,"dqv:value":%s,'
+    b'"dqv:isMeasurementOf":{"@id":"urn:mqa:metric:totalScore","@type":"dqv:Metric","skos:prefLabel":"Total Quality Score"},'
+    b'"schema:rating":{"@type":"schema:Rating","schema:ratingValue":%s,"schema:worstRating":"Bad","schema:bestRating":"Excellent"},'
+    b'"dqv:hasQualityMeasurement":['
+)
+_JSONLD_DIMENSION = b'{"@id":%s,"@type":"dqv:QualityMeasurement","dqv:value":%s,"dqv:isMeasurementOf":%s}'
+_JSONLD_METRIC = (
+    b'{"@id":%s,"@type":"dqv:QualityMeasurement","dqv:value":%s,"dqv:isMeasurementOf":%s,"dqv:computedOn":%s,'
+    b'"schema:population":%s,"schema:observationCount":%s,"schema:percentage":%s}'
+)
+_DIMENSION_METRICS_JSON = {key: orjson.dumps(node) for key, node in _DIMENSION_METRICS.items()}
+
+@lru_cache(maxsize=1024)
+def _metric_node_json(metric_id: str, dimension: str, lang: str) -> bytes:
+    """Encoded dqv:Metric node for a metric, which only depends on its id, dimension and language."""
+    return orjson.dumps({
+        "@id": METRIC_URN.get(metric_id) or "urn:mqa:metric:" + metric_id,
+        "@type": "dqv:Metric",
+        "skos:prefLabel": get_metric_label(metric_id, lang),
+        "dqv:inDimension": _DIMENSION_REFS[dimension]
+    })
+
+def render_jsonld_dqv(report: Dict[str, Any], lang: str = "en") -> bytes:
+    """
+    Render a quality report directly as serialized JSON-LD (DQV).
+    
+    Produces the same document as ``orjson.dumps(convert_to_jsonld_dqv(report, lang))``,
+    but fills pre-encoded templates instead of building the nested dicts.
+    
+    Args:
+        report: Quality report data from the API
+        lang: Language for labels
+        
+    Returns:
+        UTF-8 encoded JSON-LD representation of the quality report
+    """
+    dumps = orjson.dumps
+    source = report['source']
+    created = report['created']
+    measurement_id = "urn:mqa:measurement:" + _safe_urn(source) + "-" + created
+    computed_on = dumps({"@id": source, "@type": "dcat:Dataset"})
+    
+    head = _JSONLD_HEAD % (
+        dumps(measurement_id),
+        dumps(created + "T00:00:00Z"),
+        dumps("Quality Assessment for " + source),
+        computed_on,
+        dumps(report['totalScore']),
+        dumps(report['rating']),
+    )
+    
+    # Dimension measurements
+    measurements = [
+        _JSONLD_DIMENSION % (dumps(measurement_id + "-" + dim_key), dumps(dim_value), _DIMENSION_METRICS_JSON[dim_key])
+        for dim_key, dim_value in report['dimensions'].items()
+    ]
+    
+    # Metric measurements with localized labels
+    for metric in report.get('metrics') or ():
+        measurements.append(_JSONLD_METRIC % (
+            dumps(metric['id']),
+            dumps(metric['points']),
+            _metric_node_json(metric['id'], metric['dimension'], lang),
+            computed_on,
+            dumps(metric['population']),
+            dumps(metric['count']),
+            dumps(metric['percentage']),
+        ))
+    
+    return b"".join((head, b",".join(measurements), b"]}"))
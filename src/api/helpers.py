@@ -1,13 +1,43 @@
+import asyncio
 import logging
+import sqlite3
+import ssl
+import time
+from typing import Dict, Iterable
+
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import SSLError
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so connections (and TLS handshakes) are reused across checks
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# A single ranged GET replaces the HEAD -> GET fallback: at most one byte of the body is requested
+_RANGE_HEADERS = {"Range": "bytes=0-0"}
+
+def _status_ok(status_code: int) -> bool:
+    """Whether the status of a ranged GET means the resource is accessible."""
+    # 206 is covered by 2xx; 416 means the resource exists but is empty
+    return 200 <= status_code < 300 or status_code == 416
+
+def _ranged_get_ok(url: str, timeout: int, verify: bool) -> bool:
+    """Issue a streamed GET for the first byte of a URL and check the status code."""
+    with _SESSION.get(
+        url,
+        timeout=timeout,
+        allow_redirects=True,
+        verify=verify,
+        stream=True,
+        headers=_RANGE_HEADERS
+    ) as response:
+        return _status_ok(response.status_code)
+
 def check_url_status(url: str, timeout: int = 5, verify: bool = True, allow_insecure: bool = False) -> bool:
     """
     Check if a URL is accessible.
@@ -21,65 +51,211 @@ def check_url_status(url: str, timeout: int = 5, verify: bool = True, allow_inse
     Returns:
         True if accessible with 2xx status code, False otherwise
     """
-    import requests
-    from requests.exceptions import SSLError
-
     # Normalize URL if needed
     if not url.startswith(('http://', 'https://')):
         url = f"http://{url}"
 
     try:
-        # First try HEAD request which is faster
         try:
-            response = requests.head(
-                url, 
-                timeout=timeout, 
-                allow_redirects=True, 
-                verify=verify
-            )
-            if 200 <= response.status_code < 300:
-                return True
+            return _ranged_get_ok(url, timeout, verify)
         except SSLError as e:
             if allow_insecure:
                 # If SSL validation fails and we allow insecure, retry without verification
-                logger.warning(f"SSL verification failed for {url}, retrying without verification")
-                response = requests.head(
-                    url, 
-                    timeout=timeout, 
-                    allow_redirects=True, 
-                    verify=False
-                )
-                if 200 <= response.status_code < 300:
-                    return True
+                logger.warning("SSL verification failed for %s, retrying without verification", url)
+                return _ranged_get_ok(url, timeout, False)
             else:
                 raise e
+            
+    except Exception as e:
+        logger.error("Error checking URL %s: %s", url, e)
+        return False
+
+def _is_ssl_error(exc: BaseException) -> bool:
+    """Return True if an httpx error was caused by SSL verification."""
+    while exc is not None:
+        if isinstance(exc, ssl.SSLError):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+async def check_url_status_async(url: str, timeout: int = 5, verify: bool = True, allow_insecure: bool = False) -> bool:
+    """
+    Check if a URL is accessible without blocking the event loop.
+    
+    Async counterpart of check_url_status for use from coroutines.
+    
+    Args:
+        url: The URL to check
+        timeout: Connection timeout in seconds
+        verify: Whether to verify SSL certificates
+        allow_insecure: If True, retry with verify=False on SSL error
+    
+    Returns:
+        True if accessible with 2xx status code, False otherwise
+    """
+    # Normalize URL if needed
+    if not url.startswith(('http://', 'https://')):
+        url = f"http://{url}"
+
+    async def probe(verify_ssl: bool) -> bool:
+        async with httpx.AsyncClient(verify=verify_ssl, follow_redirects=True, timeout=timeout) as client:
+            # First try HEAD request which is faster
+            try:
+                response = await client.head(url)
+                if 200 <= response.status_code < 300:
+                    return True
+            except httpx.HTTPError as e:
+                if _is_ssl_error(e):
+                    raise
+                # If HEAD fails, try GET
+            
+            # If HEAD didn't work or status code wasn't 2xx, try a ranged GET for the first byte
+            async with client.stream("GET", url, headers=_RANGE_HEADERS) as response:
+                return _status_ok(response.status_code)
+
+    try:
+        try:
+            return await probe(verify)
+        except httpx.HTTPError as e:
+            if verify and allow_insecure and _is_ssl_error(e):
+                # If SSL validation fails and we allow insecure, retry without verification
+                logger.warning("SSL verification failed for %s, retrying without verification", url)
+                return await probe(False)
+            raise
+    except Exception as e:
+        logger.error("Error checking URL %s: %s", url, e)
+        return False
+
+async def _probe_url(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str, timeout: int) -> bool:
+    """Probe a single URL with HEAD, falling back to a ranged GET."""
+    # Normalize URL if needed
+    if not url.startswith(('http://', 'https://')):
+        url = f"http://{url}"
+
+    async with semaphore:
+        try:
+            response = await client.head(url, timeout=timeout)
+            if 200 <= response.status_code < 300:
+                return True
         except Exception:
             # If HEAD fails, try GET
             pass
-                
-        # If HEAD didn't work or status code wasn't 2xx, try GET
+
         try:
-            response = requests.get(
-                url, 
-                timeout=timeout, 
-                allow_redirects=True, 
-                verify=verify
-            )
-            return 200 <= response.status_code < 300
-        except SSLError as e:
-            if allow_insecure:
-                # If SSL validation fails and we allow insecure, retry without verification
-                logger.warning(f"SSL verification failed for {url}, retrying without verification")
-                response = requests.get(
-                    url, 
-                    timeout=timeout, 
-                    allow_redirects=True, 
-                    verify=False
-                )
-                return 200 <= response.status_code < 300
-            else:
-                raise e
-            
-    except Exception as e:
-        logger.error(f"Error checking URL {url}: {str(e)}")
-        return False
\ No newline at end of file
+            # Ranged, streamed GET: at most one byte of the body is requested and none is read
+            async with client.stream("GET", url, timeout=timeout, headers=_RANGE_HEADERS) as response:
+                return _status_ok(response.status_code)
+        except Exception as e:
+            logger.error("Error checking URL %s: %s", url, e)
+            return False
+
+async def check_urls_status(urls: Iterable[str], timeout: int = 5, verify: bool = True,
+                            concurrency: int = 32) -> Dict[str, bool]:
+    """
+    Check the accessibility of many URLs concurrently.
+    
+    Args:
+        urls: The URLs to check (duplicates are probed once)
+        timeout: Connection timeout in seconds
+        verify: Whether to verify SSL certificates
+        concurrency: Maximum number of in-flight requests
+    
+    Returns:
+        Dictionary mapping each distinct URL to True if accessible with 2xx status code
+    """
+    distinct_urls = list(dict.fromkeys(urls))
+    if not distinct_urls:
+        return {}
+
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(verify=verify, follow_redirects=True, limits=limits) as client:
+        results = await asyncio.gather(
+            *(_probe_url(client, semaphore, url, timeout) for url in distinct_urls)
+        )
+    return dict(zip(distinct_urls, results))
+
+
+class URLStatusCache:
+    """
+    Persistent cache of URL accessibility results with a time to live.
+    
+    Catalogs are validated again and again with the same distribution URLs;
+    cached results skip the network for URLs checked recently.
+    """
+
+    # Límite de parámetros por consulta en SQLite
+    _BATCH = 500
+
+    def __init__(self, path: str, ttl: int = 24 * 3600, negative_ttl: int = 3600):
+        """
+        Args:
+            path: Path to the SQLite cache file
+            ttl: Seconds an accessible URL is considered fresh
+            negative_ttl: Seconds an inaccessible URL is considered fresh
+        """
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    def _connect(self) -> sqlite3.Connection:
+        # Conexión por operación: la caché se usa desde varios hilos
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS url_status (url TEXT PRIMARY KEY, ok INTEGER NOT NULL, checked REAL NOT NULL)"
+        )
+        return conn
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """
+        Get the cached status of the URLs that are still fresh.
+        
+        Args:
+            urls: URLs to look up
+        
+        Returns:
+            Dictionary mapping each fresh cached URL to its accessibility
+        """
+        urls = list(urls)
+        now = time.time()
+        results = {}
+        try:
+            conn = self._connect()
+            try:
+                for i in range(0, len(urls), self._BATCH):
+                    batch = urls[i:i + self._BATCH]
+                    rows = conn.execute(
+                        f"SELECT url, ok, checked FROM url_status WHERE url IN ({','.join('?' * len(batch))})",
+                        batch,
+                    )
+                    for url, ok, checked in rows:
+                        if now - checked < (self.ttl if ok else self.negative_ttl):
+                            results[url] = bool(ok)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("URL status cache unavailable (%s): %s", self.path, e)
+        return results
+
+    def put_many(self, results: Dict[str, bool]) -> None:
+        """
+        Store the status of several URLs in a single transaction.
+        
+        Args:
+            results: Dictionary mapping URLs to their accessibility
+        """
+        if not results:
+            return
+        now = time.time()
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO url_status (url, ok, checked) VALUES (?, ?, ?)",
+                        ((url, int(ok), now) for url, ok in results.items()),
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("URL status cache unavailable (%s): %s", self.path, e)
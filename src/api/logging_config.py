@@ -0,0 +1,19 @@
+"""
+Logging configuration for the Metadata Quality API.
+
+Modules only create their logger with ``logging.getLogger(__name__)``;
+the root handler is configured once here.
+"""
+import logging
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure the root logger for the API.
+
+    Args:
+        level: Minimum level of the records to emit
+    """
+    logging.basicConfig(level=level, format=LOG_FORMAT)
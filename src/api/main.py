@@ -2,37 +2,94 @@
 FastAPI application for the Metadata Quality API.
 This module defines the API endpoints for validating and retrieving metadata quality reports.
 """
-from fastapi import FastAPI, Request, HTTPException, Depends, Query
+from fastapi import FastAPI, Request, HTTPException, Depends, Query, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from enum import Enum
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Any
+import os
 import urllib.parse
 import logging
+import orjson
 from pydantic import BaseModel
 
+from .logging_config import configure_logging
 from .shacl_updater import update_shacl_files
 from .models import QualityReport
-from .repositories.tinydb_repo import TinyDBRepository
-from .validators import register_standard_checkers, validate_metadata_quality, validate_metadata_from_content
+from .config import DB_PATH, LEGACY_TINYDB_PATH
+from .repositories.sqlite_repo import SQLiteRepository
+from .validators import (
+    register_standard_checkers, validate_metadata_quality, validate_metadata_from_content, warm_shapes_cache,
+    warm_vocab_cache, clear_shapes_cache
+)
 
-from .converters import convert_to_jsonld_dqv
+from .converters import render_jsonld_dqv
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Configure rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
 # Initialize the repository
-repo = TinyDBRepository()
+os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
+repo = SQLiteRepository(DB_PATH)
+
+# JSON-LD (DQV) ya generado por (id del informe, idioma); los informes son inmutables
+_JSONLD_CACHE: "OrderedDict[Tuple[int, str], bytes]" = OrderedDict()
+JSONLD_CACHE_SIZE = 256
+
+def _serialized_jsonld(report_id: int, report: Dict[str, Any], lang: str = "en") -> bytes:
+    """Serialized JSON-LD (DQV) of a stored report, rendered once per report ID."""
+    key = (report_id, lang)
+    content = _JSONLD_CACHE.get(key)
+    if content is None:
+        content = _JSONLD_CACHE[key] = render_jsonld_dqv(report, lang)
+        if len(_JSONLD_CACHE) > JSONLD_CACHE_SIZE:
+            _JSONLD_CACHE.popitem(last=False)
+    else:
+        _JSONLD_CACHE.move_to_end(key)
+    return content
+
+def store_report(report_data: Dict[str, Any]) -> None:
+    """Persist a validated report; runs as a background task after the response is sent."""
+    try:
+        doc_id = repo.insert_report(report_data)
+        logger.info("Report stored with ID: %s", doc_id)
+    except Exception as e:
+        logger.error("Error storing report for %s: %s", report_data.get("source"), e)
+
+def _iter_json_array(first: Dict[str, Any], rest: Iterator[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode reports as a JSON array one item at a time."""
+    yield b"["
+    yield orjson.dumps(first)
+    for report in rest:
+        yield b","
+        yield orjson.dumps(report)
+    yield b"]"
+
+def _stream_reports(reports: Iterable[Dict[str, Any]], headers: Optional[Dict[str, str]] = None) -> Optional[StreamingResponse]:
+    """Stream reports as a JSON array, or return None if there are none."""
+    iterator = iter(reports)
+    first = next(iterator, None)
+    if first is None:
+        return None
+    return StreamingResponse(_iter_json_array(first, iterator), media_type="application/json", headers=headers)
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check the If-None-Match header of a conditional GET against an ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
 
 # Create FastAPI application
 app = FastAPI(
@@ -45,6 +102,9 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Compress larger responses (reports, JSON-LD, history); registered before CORS so CORS stays outermost
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -54,6 +114,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Supported validation models and output formats (validated by FastAPI, 422 otherwise)
+ModelName = Literal["dcat_ap", "dcat_ap_es", "nti_risp"]
+
+class OutputFormat(str, Enum):
+    """Output formats of the reports; matched case-insensitively (e.g. "JSONLD")."""
+    JSON = "json"
+    JSONLD = "jsonld"
+    
+    @classmethod
+    def _missing_(cls, value):
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.lower())
+        return None
+
 # Define content validation request model
 class ContentValidationRequest(BaseModel):
     content: str
@@ -71,123 +145,127 @@ def read_root():
 
 @app.post("/validate")
 @limiter.limit("5/minute")
-async def validate_url(request: Request, url: str, model: str = "dcat_ap_es", format: str = "json"):
+async def validate_url(request: Request, background_tasks: BackgroundTasks, url: str, model: ModelName = "dcat_ap_es", format: OutputFormat = OutputFormat.JSON):
     """
     Validate the metadata quality of a provided URL.
     
     Args:
         request: The FastAPI request object
+        background_tasks: Tasks run after the response is sent (report storage)
         url: URL to a catalog in RDF or TTL format
         model: Model to validate against ('dcat_ap', 'dcat_ap_es', 'nti_risp')
         format: Output format ("json" or "jsonld")
     
     Returns:
-        A quality report in the specified format
+        A quality report in the specified format (stored in the background,
+        so it may not be visible in /report until shortly after the response)
     
     Raises:
         HTTPException: On validation errors or rate limiting
     """
-    logger.info(f"Validating URL: {url} with model: {model}")
-    
-    # Validate model parameter
-    if model not in ["dcat_ap", "dcat_ap_es", "nti_risp"]:
-        raise HTTPException(status_code=400, detail=f"Unsupported model: {model}")
+    logger.info("Validating URL: %s with model: %s", url, model)
     
     try:
-        # Validate the metadata and generate a report
-        report_data = validate_metadata_quality(url, model=model)
+        # Validate the metadata and generate a report (blocking I/O, run off the event loop)
+        report_data = await run_in_threadpool(validate_metadata_quality, url, model=model)
         
-        # Store the report
-        doc_id = repo.insert_report(report_data)
-        logger.info(f"Report stored with ID: {doc_id}")
+        # Store the report once the response has been sent
+        background_tasks.add_task(store_report, report_data)
         
         # Convert to JSON-LD if requested
-        if format.lower() == "jsonld":
-            from .converters import convert_to_jsonld_dqv
-            return convert_to_jsonld_dqv(report_data)
+        if format == OutputFormat.JSONLD:
+            return Response(content=render_jsonld_dqv(report_data), media_type="application/json")
         
         return report_data
     
     except Exception as e:
-        logger.error(f"Error validating URL: {str(e)}")
+        logger.error("Error validating URL: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.post("/validate-content")
 @limiter.limit("5/minute")
-async def validate_content(request: Request, content_request: ContentValidationRequest, model: str = "dcat_ap_es", format: str = "json"):
+async def validate_content(request: Request, background_tasks: BackgroundTasks, content_request: ContentValidationRequest, model: ModelName = "dcat_ap_es", format: OutputFormat = OutputFormat.JSON):
     """
     Validate the metadata quality of directly provided content.
     
     Args:
         request: The FastAPI request object
+        background_tasks: Tasks run after the response is sent (report storage)
         content_request: Content validation request with text and format
         model: Model to validate against ('dcat_ap', 'dcat_ap_es', 'nti_risp')
         format: Output format ("json" or "jsonld")
     
     Returns:
-        A quality report in the specified format
+        A quality report in the specified format (stored in the background,
+        so it may not be visible in /report until shortly after the response)
     
     Raises:
         HTTPException: On validation errors or rate limiting
     """
-    logger.info(f"Validating direct content with format: {content_request.content_type}")
-
-    # Validate model parameter
-    if model not in ["dcat_ap", "dcat_ap_es", "nti_risp"]:
-        raise HTTPException(status_code=400, detail=f"Unsupported model: {model}")
+    logger.info("Validating direct content with format: %s", content_request.content_type)
 
     try:
-        # Validate the metadata content and generate a report
-        report_data = validate_metadata_from_content(
+        # Validate the metadata content and generate a report (blocking I/O, run off the event loop)
+        report_data = await run_in_threadpool(
+            validate_metadata_from_content,
             content=content_request.content,
             content_type=content_request.content_type,
             model=model
         )
         
-        # Store the report
-        doc_id = repo.insert_report(report_data)
-        logger.info(f"Report stored with ID: {doc_id}")
+        # Store the report once the response has been sent
+        background_tasks.add_task(store_report, report_data)
         
         # Convert to JSON-LD if requested
-        if format.lower() == "jsonld":
-            return convert_to_jsonld_dqv(report_data)
+        if format == OutputFormat.JSONLD:
+            return Response(content=render_jsonld_dqv(report_data), media_type="application/json")
         
         return report_data
     
     except Exception as e:
-        logger.error(f"Error validating content: {str(e)}")
+        logger.error("Error validating content: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.get("/report/{encoded_url}", response_model=QualityReport)
-async def get_latest_report(encoded_url: str):
+@app.get("/report/{encoded_url:path}", response_model=QualityReport)
+async def get_latest_report(request: Request, encoded_url: str, format: OutputFormat = OutputFormat.JSON):
     """
     Get the latest quality report for a URL.
     
     Args:
+        request: The FastAPI request object
         encoded_url: URL-encoded catalog URL
+        format: Output format ("json" or "jsonld")
     
     Returns:
-        The latest quality report for the URL
+        The latest quality report for the URL in the specified format
     
     Raises:
         HTTPException: If no report is found
     """
     url = urllib.parse.unquote(encoded_url)
-    logger.info(f"Getting latest report for URL: {url}")
-    
-    report = repo.get_latest_report(url)
+    logger.info("Getting latest report for URL: %s", url)
     
-    if not report:
+    # El ETag y el cuerpo salen del mismo informe (id y contenido leídos juntos)
+    latest = repo.get_latest(url)
+    if latest is None:
         raise HTTPException(status_code=404, detail="No report found for this URL")
     
-    return report
+    latest_id, report = latest
+    jsonld = format == OutputFormat.JSONLD
+    etag = f'"{latest_id}-jsonld"' if jsonld else f'"{latest_id}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    content = _serialized_jsonld(latest_id, report) if jsonld else orjson.dumps(report)
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
 
-@app.get("/history/{encoded_url}", response_model=List[QualityReport])
-async def get_history(encoded_url: str):
+@app.get("/history/{encoded_url:path}", response_model=List[QualityReport])
+async def get_history(request: Request, encoded_url: str):
     """
     Get the history of quality reports for a URL.
     
     Args:
+        request: The FastAPI request object
         encoded_url: URL-encoded catalog URL
     
     Returns:
@@ -197,14 +275,20 @@ async def get_history(encoded_url: str):
         HTTPException: If no reports are found
     """
     url = urllib.parse.unquote(encoded_url)
-    logger.info(f"Getting history for URL: {url}")
+    logger.info("Getting history for URL: %s", url)
+    
+    latest_id = repo.get_latest_id(url)
+    etag = f'"history-{latest_id}"'
+    if latest_id is not None and _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
     
-    reports = repo.get_history(url)
+    headers = {"ETag": etag} if latest_id is not None else None
+    response = _stream_reports(repo.get_history(url), headers=headers)
     
-    if not reports:
+    if response is None:
         raise HTTPException(status_code=404, detail="No reports found for this URL")
     
-    return reports
+    return response
 
 @app.get("/reports/by-date", response_model=List[QualityReport])
 async def get_reports_by_date_range(start_date: str, end_date: str):
@@ -221,15 +305,15 @@ async def get_reports_by_date_range(start_date: str, end_date: str):
     Raises:
         HTTPException: If no reports are found or dates are invalid
     """
-    logger.info(f"Getting reports from {start_date} to {end_date}")
+    logger.info("Getting reports from %s to %s", start_date, end_date)
     
     try:
-        reports = repo.get_reports_by_date_range(start_date, end_date)
+        response = _stream_reports(repo.get_reports_by_date_range(start_date, end_date))
         
-        if not reports:
+        if response is None:
             raise HTTPException(status_code=404, detail="No reports found in this date range")
         
-        return reports
+        return response
     
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -248,7 +332,7 @@ async def get_reports_by_rating(rating: str):
     Raises:
         HTTPException: If no reports are found or rating is invalid
     """
-    logger.info(f"Getting reports with rating: {rating}")
+    logger.info("Getting reports with rating: %s", rating)
     
     try:
         reports = repo.get_reports_by_rating(rating)
@@ -275,6 +359,10 @@ async def update_shacl(request: Request, force: bool = Query(False, description=
     """
     try:
         updated, total = update_shacl_files(force=force)
+        if updated:
+            # Las formas ya parseadas (y los resultados que dependen de ellas) quedan obsoletas
+            clear_shapes_cache()
+            warm_shapes_cache()
         return {
             "success": True,
             "message": f"SHACL files updated: {updated}/{total}",
@@ -282,12 +370,20 @@ async def update_shacl(request: Request, force: bool = Query(False, description=
             "total": total
         }
     except Exception as e:
-        logger.error(f"Error updating SHACL files: {e}")
+        logger.error("Error updating SHACL files: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to update SHACL files: {str(e)}"
         )
 
+def prepare_shacl_shapes():
+    """Update the SHACL files and then parse them into the shapes cache."""
+    updated, _ = update_shacl_files()
+    if updated:
+        # Una validación pudo cachear las formas anteriores (o las de la URL remota) durante la descarga
+        clear_shapes_cache()
+    warm_shapes_cache()
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize components on app startup."""
@@ -296,12 +392,24 @@ async def startup_event():
         register_standard_checkers()
         logger.info("Registered standard checkers")
     except Exception as e:
-        logger.error(f"Failed to register standard checkers: {e}")
+        logger.error("Failed to register standard checkers: %s", e)
+    
+    # Migrar los informes de la base de datos TinyDB anterior, si existe
+    if os.path.exists(LEGACY_TINYDB_PATH):
+        try:
+            imported = repo.import_tinydb(LEGACY_TINYDB_PATH)
+            if imported:
+                logger.info("Imported %d reports from %s", imported, LEGACY_TINYDB_PATH)
+        except Exception as e:
+            logger.error("Failed to import reports from %s: %s", LEGACY_TINYDB_PATH, e)
+    
+    # Cargar los vocabularios MQA una sola vez
+    warm_vocab_cache()
     
-    # Iniciar actualización de archivos SHACL en segundo plano
+    # Iniciar actualización de archivos SHACL y precarga de shapes en segundo plano
     try:
         import threading
-        threading.Thread(target=update_shacl_files, daemon=True).start()
+        threading.Thread(target=prepare_shacl_shapes, daemon=True).start()
         logger.info("Started SHACL updater background thread")
     except Exception as e:
-        logger.warning(f"Failed to start SHACL updater thread: {e}")
\ No newline at end of file
+        logger.warning("Failed to start SHACL updater thread: %s", e)
\ No newline at end of file
@@ -5,10 +5,37 @@ This module defines the data models used for validating and structuring
 metadata quality reports according to the Data Quality Vocabulary (DQV) standard.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from enum import Enum
-import re
+from datetime import date
+from functools import lru_cache
+
+# Example report shown in the OpenAPI schema, built once at import time
+_QUALITY_REPORT_EXAMPLE = {
+    "source": "https://example.com/catalog.rdf",
+    "created": "2025-03-22",
+    "totalScore": 280,
+    "rating": "Good",
+    "dimensions": {
+        "findability": 90,
+        "accessibility": 80,
+        "interoperability": 70,
+        "reusability": 30,
+        "contextuality": 10
+    },
+    "metrics": [
+        {
+            "id": "dcat_keyword",
+            "dimension": "findability",
+            "count": 46,
+            "population": 46,
+            "percentage": 1.0,
+            "points": 30.0,
+            "weight": 30
+        }
+    ]
+}
 
 
 class Rating(str, Enum):
@@ -28,6 +55,17 @@ class DimensionType(str, Enum):
     CONTEXTUALITY = "contextuality"
 
 
+@lru_cache(maxsize=4096)
+def _resolve_label(metric_id: str, label_en: Optional[str], label_es: Optional[str], lang: str) -> str:
+    """Pick the label for a metric; memoized since the same metrics repeat across reports."""
+    if lang == "es" and label_es:
+        return label_es
+    elif label_en:
+        return label_en
+    else:
+        return metric_id.replace("_", " ").capitalize()
+
+
 class MetricItem(BaseModel):
     """Individual metric measured during the evaluation."""
     id: str
@@ -43,12 +81,7 @@ class MetricItem(BaseModel):
     
     def get_label(self, lang: str = "en") -> str:
         """Get the localized label for this metric."""
-        if lang == "es" and self.label_es:
-            return self.label_es
-        elif self.label_en:
-            return self.label_en
-        else:
-            return self.id.replace("_", " ").capitalize()
+        return _resolve_label(self.id, self.label_en, self.label_es, lang)
 
 
 class DimensionScores(BaseModel):
@@ -63,43 +96,51 @@ class DimensionScores(BaseModel):
 class QualityReport(BaseModel):
     """Complete metadata quality report."""
     source: str = Field(..., description="URL of the evaluated catalog")
-    created: str = Field(..., description="Evaluation date in YYYY-MM-DD format")
+    # Parsed by pydantic-core: rejects malformed and impossible dates (e.g. 2025-13-45)
+    created: date = Field(..., description="Evaluation date in YYYY-MM-DD format")
     totalScore: int = Field(..., ge=0, le=405)
     rating: Rating
     dimensions: DimensionScores
     metrics: Optional[List[MetricItem]] = Field(default=None)
 
-    @validator('created')
-    def validate_date_format(cls, v):
-        if not re.match(r'^\d{4}-\d{2}-\d{2}$', v):
-            raise ValueError('Date must be in YYYY-MM-DD format')
-        return v
-
-    class Config:
-        """Pydantic model configuration."""
-        schema_extra = {
-            "example": {
-                "source": "https://example.com/catalog.rdf",
-                "created": "2025-03-22",
-                "totalScore": 280,
-                "rating": "Good",
-                "dimensions": {
-                    "findability": 90,
-                    "accessibility": 80,
-                    "interoperability": 70,
-                    "reusability": 30,
-                    "contextuality": 10
-                },
-                "metrics": [
-                    {
-                        "id": "dcat_keyword",
-                        "dimension": "findability",
-                        "count": 46,
-                        "population": 46,
-                        "percentage": 1.0,
-                        "points": 30.0,
-                        "weight": 30
-                    }
-                ]
-            }
-        }
\ No newline at end of file
+    # Pydantic model configuration
+    model_config = ConfigDict(json_schema_extra={"example": _QUALITY_REPORT_EXAMPLE})
+
+
+def check_indexed_fields(report_data: Mapping[str, Any]) -> Tuple[str, str, str]:
+    """
+    Validate only the report fields that repositories index and query.
+
+    Used by the fast insert path for reports that were already validated
+    when first stored (e.g. the TinyDB import), which skips the full
+    QualityReport validation.
+
+    Args:
+        report_data: Dictionary with report data
+
+    Returns:
+        Tuple with (source, created as YYYY-MM-DD, rating value)
+
+    Raises:
+        ValueError: If any of the indexed fields is missing or invalid
+    """
+    try:
+        source = report_data["source"]
+        created = report_data["created"]
+        rating = Rating(report_data["rating"]).value
+        total_score = report_data["totalScore"]
+    except KeyError as e:
+        raise ValueError(f"Missing report field: {e}")
+
+    if not isinstance(source, str):
+        raise ValueError("source must be a string")
+    if isinstance(created, date):
+        created = created.isoformat()
+    elif not isinstance(created, str) or len(created) != 10:
+        raise ValueError("Date must be in YYYY-MM-DD format")
+    else:
+        # Rejects impossible dates such as 2025-13-45
+        date.fromisoformat(created)
+    if not isinstance(total_score, (int, float)) or not 0 <= total_score <= 405:
+        raise ValueError("totalScore must be a number between 0 and 405")
+    return source, created, rating
@@ -6,5 +6,6 @@ for storing and retrieving quality reports.
 """
 
 from .tinydb_repo import TinyDBRepository
+from .sqlite_repo import SQLiteRepository
 
-__all__ = ['TinyDBRepository']
\ No newline at end of file
+__all__ = ['TinyDBRepository', 'SQLiteRepository']
\ No newline at end of file
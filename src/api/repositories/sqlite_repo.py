@@ -0,0 +1,299 @@
+"""
+SQLite repository implementation.
+
+This module implements the repository pattern using SQLite (WAL mode)
+for storing and retrieving quality reports. It mirrors the interface of
+TinyDBRepository but answers queries through indexes instead of full scans.
+"""
+
+import sqlite3
+import threading
+import orjson
+from ..models import QualityReport, check_indexed_fields
+from typing import Iterator, List, Optional, Dict, Any, Tuple
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    created TEXT NOT NULL,
+    rating TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_url_created ON reports(url, created DESC);
+CREATE INDEX IF NOT EXISTS ix_rating ON reports(rating);
+CREATE INDEX IF NOT EXISTS ix_created ON reports(created);
+"""
+
+
+class SQLiteRepository:
+    """Repository implementation using SQLite for storage."""
+
+    def __init__(self, db_path="mqa_db.sqlite"):
+        """
+        Initialize the SQLite database and create the schema if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        # Una conexión por hilo: WAL permite lectores concurrentes mientras se escribe
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the SQLite connection for the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _fetch_reports(self, sql: str, params: tuple) -> List[Dict[str, Any]]:
+        """Run a query selecting the payload column and decode each report."""
+        rows = self._connection().execute(sql, params).fetchall()
+        return [orjson.loads(payload) for (payload,) in rows]
+
+    def _iter_reports(self, sql: str, params: tuple) -> Iterator[Dict[str, Any]]:
+        """Run a query selecting the payload column and lazily decode each report."""
+        # Conexión propia: el generador puede consumirse desde otro hilo (p. ej. StreamingResponse)
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        try:
+            for (payload,) in conn.execute(sql, params):
+                yield orjson.loads(payload)
+        finally:
+            conn.close()
+
+    def insert_report(self, report_data: Dict[str, Any]) -> int:
+        """
+        Validate and insert a new report.
+
+        Args:
+            report_data: Dictionary with report data
+
+        Returns:
+            ID of the inserted row
+
+        Raises:
+            ValidationError: If data doesn't meet the schema requirements
+        """
+        # Use Pydantic for validation
+        validated_report = QualityReport(**report_data)
+
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO reports (url, created, rating, payload) VALUES (?, ?, ?, ?)",
+                (
+                    validated_report.source,
+                    validated_report.created.isoformat(),
+                    validated_report.rating.value,
+                    # Serialized straight from the model by pydantic-core, no intermediate dict
+                    validated_report.model_dump_json().encode(),
+                ),
+            )
+        return cursor.lastrowid
+
+    def insert_reports(self, reports: List[Dict[str, Any]]) -> List[int]:
+        """
+        Validate and insert several reports in a single transaction.
+
+        Args:
+            reports: List of dictionaries with report data
+
+        Returns:
+            IDs of the inserted rows, in the same order
+
+        Raises:
+            ValidationError: If any report doesn't meet the schema requirements;
+                nothing is inserted in that case
+        """
+        validated_reports = [QualityReport(**report_data) for report_data in reports]
+
+        conn = self._connection()
+        row_ids = []
+        # Un único commit para todo el lote
+        with conn:
+            for validated_report in validated_reports:
+                cursor = conn.execute(
+                    "INSERT INTO reports (url, created, rating, payload) VALUES (?, ?, ?, ?)",
+                    (
+                        validated_report.source,
+                        validated_report.created.isoformat(),
+                        validated_report.rating.value,
+                        validated_report.model_dump_json().encode(),
+                    ),
+                )
+                row_ids.append(cursor.lastrowid)
+        return row_ids
+
+    def insert_reports_fast(self, reports: List[Dict[str, Any]]) -> List[int]:
+        """
+        Insert already validated reports in a single transaction, checking only the indexed fields.
+
+        For trusted callers whose reports went through QualityReport when they
+        were first stored, such as import_tinydb: the payloads are stored as
+        given, without building the model again.
+
+        Args:
+            reports: List of dictionaries with report data
+
+        Returns:
+            IDs of the inserted rows, in the same order
+
+        Raises:
+            ValueError: If any of the indexed fields of a report is missing or
+                invalid; nothing is inserted in that case
+        """
+        # Se comprueban todos antes de escribir, para no dejar un lote a medias
+        rows = [(*check_indexed_fields(report_data), orjson.dumps(report_data)) for report_data in reports]
+
+        conn = self._connection()
+        row_ids = []
+        with conn:
+            for row in rows:
+                cursor = conn.execute(
+                    "INSERT INTO reports (url, created, rating, payload) VALUES (?, ?, ?, ?)", row
+                )
+                row_ids.append(cursor.lastrowid)
+        return row_ids
+
+    def import_tinydb(self, json_path: str, table: str = "_default") -> int:
+        """
+        Import the reports of a TinyDB JSON database, e.g. a legacy mqa_db.json.
+
+        The import only runs on an empty database, so calling it on every
+        startup is safe. TinyDBRepository validated the reports when it stored
+        them, so only their indexed fields are checked (insert_reports_fast).
+
+        Args:
+            json_path: Path to the TinyDB JSON file
+            table: TinyDB table holding the reports
+
+        Returns:
+            Number of imported reports
+        """
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM reports").fetchone()
+        if count:
+            return 0
+
+        with open(json_path, "rb") as f:
+            documents = orjson.loads(f.read() or b"{}").get(table, {})
+
+        # Mantener el orden de inserción original (IDs de documento de TinyDB)
+        reports = [documents[doc_id] for doc_id in sorted(documents, key=int)]
+        return len(self.insert_reports_fast(reports))
+
+    def get_latest(self, url: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Get the most recent report for a URL together with its row ID.
+
+        Args:
+            url: URL of the catalog to query
+
+        Returns:
+            Tuple of (row ID, report) or None if no reports exist
+        """
+        row = self._connection().execute(
+            "SELECT id, payload FROM reports WHERE url = ? ORDER BY created DESC, id DESC LIMIT 1",
+            (url,),
+        ).fetchone()
+        return (row[0], orjson.loads(row[1])) if row else None
+
+    def get_latest_report(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the most recent report for a URL.
+
+        Args:
+            url: URL of the catalog to query
+
+        Returns:
+            Most recent report or None if no reports exist
+        """
+        latest = self.get_latest(url)
+        return latest[1] if latest else None
+
+    def get_latest_id(self, url: str) -> Optional[int]:
+        """
+        Get the ID of the most recently inserted report for a URL.
+
+        Reports are immutable, so this identifies the current state of a
+        URL's history (e.g. for ETags) without decoding any payload.
+
+        Args:
+            url: URL of the catalog to query
+
+        Returns:
+            Highest report ID for the URL or None if no reports exist
+        """
+        (latest_id,) = self._connection().execute(
+            "SELECT MAX(id) FROM reports WHERE url = ?", (url,)
+        ).fetchone()
+        return latest_id
+
+    def get_history(self, url: str) -> Iterator[Dict[str, Any]]:
+        """
+        Get the history of reports for a URL.
+
+        Args:
+            url: URL of the catalog to query
+
+        Returns:
+            Iterator over historical reports, read lazily from the database
+        """
+        return self.get_history_iter(url)
+
+    def get_history_iter(self, url: str, limit: Optional[int] = None, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over a page of the history of reports for a URL.
+
+        Args:
+            url: URL of the catalog to query
+            limit: Maximum number of reports to yield (all if None)
+            offset: Number of reports to skip, oldest first
+
+        Returns:
+            Iterator over historical reports (oldest first), read lazily from the database
+        """
+        # LIMIT -1 es "sin límite" en SQLite
+        return self._iter_reports(
+            "SELECT payload FROM reports WHERE url = ? ORDER BY id LIMIT ? OFFSET ?",
+            (url, -1 if limit is None else limit, offset),
+        )
+
+    def get_reports_by_date_range(self, start_date: str, end_date: str) -> Iterator[Dict[str, Any]]:
+        """
+        Get reports within a date range.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            Iterator over reports in the range (oldest first), read lazily from the database
+        """
+        # created es texto ISO-8601 (YYYY-MM-DD): el orden lexicográfico es cronológico
+        # y la consulta es un recorrido por rango sobre ix_created
+        return self._iter_reports(
+            "SELECT payload FROM reports WHERE created BETWEEN ? AND ? ORDER BY created, id",
+            (start_date, end_date),
+        )
+
+    def get_reports_by_rating(self, rating: str) -> List[Dict[str, Any]]:
+        """
+        Get reports with a specific rating.
+
+        Args:
+            rating: Rating to search for
+
+        Returns:
+            List of reports with that rating
+        """
+        return self._fetch_reports(
+            "SELECT payload FROM reports WHERE rating = ? ORDER BY id",
+            (rating,),
+        )
@@ -5,12 +5,53 @@ This module implements the repository pattern using TinyDB
 for storing and retrieving quality reports.
 """
 
-from tinydb import TinyDB, Query
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from itertools import islice
+from operator import itemgetter
+import orjson
+from tinydb import TinyDB
+from tinydb.storages import JSONStorage
+from tinydb.table import Document
 from ..models import QualityReport
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 
+# Campos consultados por igualdad; created se indexa aparte como lista ordenada
+INDEXED_FIELDS = ("source", "rating")
+
+
+class OrjsonStorage(JSONStorage):
+    """
+    TinyDB JSON storage that encodes and decodes with orjson.
+    
+    TinyDB rewrites the whole file on every insert, so the stdlib json encoder
+    is the main cost of a write. The file format is plain JSON, readable by
+    the default JSONStorage.
+    """
+    
+    def __init__(self, path: str, create_dirs=False, encoding=None, access_mode='rb+', **kwargs):
+        # orjson trabaja con bytes: el archivo se abre en modo binario
+        super().__init__(path, create_dirs=create_dirs, encoding=encoding, access_mode=access_mode, **kwargs)
+    
+    def read(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        self._handle.seek(0)
+        content = self._handle.read()
+        # Empty file: return None so TinyDB initializes the database
+        return orjson.loads(content) if content else None
+    
+    def write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        self._handle.seek(0)
+        self._handle.write(orjson.dumps(data))
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        # Remove data behind the cursor in case the file has gotten shorter
+        self._handle.truncate()
+
+
 class TinyDBRepository:
     """Repository implementation using TinyDB for storage."""
     
@@ -21,7 +62,58 @@ class TinyDBRepository:
         Args:
             db_path: Path to the TinyDB JSON file
         """
-        self.db = TinyDB(db_path)
+        self.db = TinyDB(db_path, storage=OrjsonStorage)
+        
+        # Índices en memoria para no recorrer la tabla completa en cada consulta.
+        # Asumen que este repositorio es el único que escribe en el fichero.
+        # Se lee la tabla una sola vez para que todos los índices compartan los mismos documentos
+        docs = [self._intern_values(doc) for doc in self.db.all()]
+        self._indexes: Dict[str, Dict[Any, List[Document]]] = {}
+        for field in INDEXED_FIELDS:
+            self.create_index(field, docs)
+        self._build_created_index(docs)
+    
+    @staticmethod
+    def _intern_values(doc: Document) -> Document:
+        """
+        Intern the enum values of a document read from disk.
+        
+        Rating and dimension values come from a small closed set but the JSON
+        decoder creates a new string for every occurrence; interning makes all
+        documents share the enum's own string objects.
+        """
+        doc["rating"] = sys.intern(doc["rating"])
+        for metric in doc.get("metrics") or ():
+            metric["dimension"] = sys.intern(metric["dimension"])
+        return doc
+    
+    def create_index(self, field: str, docs: Optional[List[Document]] = None) -> None:
+        """
+        Build an equality index on a document field.
+        
+        Args:
+            field: Name of the top-level field to index
+            docs: Documents to index; defaults to reading the whole table
+        """
+        index = defaultdict(list)
+        for doc in self.db.all() if docs is None else docs:
+            index[doc[field]].append(doc)
+        self._indexes[field] = index
+    
+    def _build_created_index(self, docs: List[Document]) -> None:
+        """Build the sorted index on created used for date range scans."""
+        docs = sorted(docs, key=lambda doc: (doc["created"], doc.doc_id))
+        self._created_keys = [doc["created"] for doc in docs]
+        self._created_docs = docs
+    
+    def _index_document(self, doc: Document) -> None:
+        """Add a newly inserted document to every index."""
+        for field, index in self._indexes.items():
+            index[doc[field]].append(doc)
+        # bisect_right keeps insertion order among reports with the same date
+        pos = bisect_right(self._created_keys, doc["created"])
+        self._created_keys.insert(pos, doc["created"])
+        self._created_docs.insert(pos, doc)
     
     def insert_report(self, report_data: Dict[str, Any]) -> int:
         """
@@ -39,10 +131,54 @@ class TinyDBRepository:
         # Use Pydantic for validation
         validated_report = QualityReport(**report_data)
         
-        # Insert into TinyDB (automatically serializes to dict)
-        doc_id = self.db.insert(validated_report.dict())
+        # Insert into TinyDB; JSON mode so the indexed copy matches what is read back from disk
+        data = validated_report.model_dump(mode="json")
+        doc_id = self.db.insert(data)
+        self._index_document(Document(data, doc_id))
         return doc_id
     
+    def insert_reports(self, reports: List[Dict[str, Any]]) -> List[int]:
+        """
+        Validate and insert several reports with a single write to disk.
+        
+        Args:
+            reports: List of dictionaries with report data
+            
+        Returns:
+            IDs of the inserted documents, in the same order
+            
+        Raises:
+            ValidationError: If any report doesn't meet the schema requirements;
+                nothing is inserted in that case
+        """
+        # Validate everything first so a bad report doesn't leave a partial batch
+        batch = [QualityReport(**report_data).model_dump(mode="json") for report_data in reports]
+        
+        # JSONStorage rewrites the whole file on every insert; insert_multiple writes it once
+        doc_ids = self.db.insert_multiple(batch)
+        for data, doc_id in zip(batch, doc_ids):
+            self._index_document(Document(data, doc_id))
+        return doc_ids
+    
+    def get_latest(self, url: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Get the most recent report for a URL together with its document ID.
+        
+        Args:
+            url: URL of the catalog to query
+            
+        Returns:
+            Tuple of (document ID, report) or None if no reports exist
+        """
+        reports = self._indexes["source"].get(url)
+        
+        if not reports:
+            return None
+            
+        # Single pass for the most recent date; ties keep the first inserted, as the sort did
+        doc = max(reports, key=itemgetter('created'))
+        return doc.doc_id, doc
+    
     def get_latest_report(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Get the most recent report for a URL.
@@ -53,14 +189,22 @@ class TinyDBRepository:
         Returns:
             Most recent report or None if no reports exist
         """
-        Report = Query()
-        reports = self.db.search(Report.source == url)
+        latest = self.get_latest(url)
+        return latest[1] if latest else None
+    
+    def get_latest_id(self, url: str) -> Optional[int]:
+        """
+        Get the ID of the most recently inserted report for a URL.
         
-        if not reports:
-            return None
+        Args:
+            url: URL of the catalog to query
             
-        # Sort by date and return the most recent
-        return sorted(reports, key=lambda x: x['created'], reverse=True)[0]
+        Returns:
+            Highest document ID for the URL or None if no reports exist
+        """
+        reports = self._indexes["source"].get(url)
+        # Index lists are kept in insertion order
+        return reports[-1].doc_id if reports else None
     
     def get_history(self, url: str) -> List[Dict[str, Any]]:
         """
@@ -72,8 +216,23 @@ class TinyDBRepository:
         Returns:
             List of historical reports
         """
-        Report = Query()
-        return self.db.search(Report.source == url)
+        return list(self._indexes["source"].get(url, ()))
+    
+    def get_history_iter(self, url: str, limit: Optional[int] = None, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over a page of the history of reports for a URL.
+        
+        Args:
+            url: URL of the catalog to query
+            limit: Maximum number of reports to yield (all if None)
+            offset: Number of reports to skip, oldest first
+            
+        Returns:
+            Iterator over historical reports (oldest first)
+        """
+        reports = self._indexes["source"].get(url, ())
+        stop = None if limit is None else offset + limit
+        return islice(reports, offset, stop)
         
     def get_reports_by_date_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """
@@ -84,13 +243,12 @@ class TinyDBRepository:
             end_date: End date (YYYY-MM-DD)
             
         Returns:
-            List of reports in the range
+            List of reports in the range (oldest first)
         """
-        Report = Query()
-        return self.db.search(
-            (Report.created >= start_date) & 
-            (Report.created <= end_date)
-        )
+        # created es texto ISO-8601 (YYYY-MM-DD): el orden lexicográfico es cronológico
+        lo = bisect_left(self._created_keys, start_date)
+        hi = bisect_right(self._created_keys, end_date)
+        return self._created_docs[lo:hi]
         
     def get_reports_by_rating(self, rating: str) -> List[Dict[str, Any]]:
         """
@@ -102,5 +260,4 @@ class TinyDBRepository:
         Returns:
             List of reports with that rating
         """
-        Report = Query()
-        return self.db.search(Report.rating == rating)
\ No newline at end of file
+        return list(self._indexes["rating"].get(sys.intern(rating), ()))
\ No newline at end of file
@@ -2,17 +2,46 @@
 Módulo para actualizar archivos SHACL desde repositorios remotos.
 """
 import os
+import json
+import shutil
 import time
 import logging
 import requests
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from .config import SHACL_DIR, SHACL_REMOTE_URLS, SHACL_UPDATE_CONFIG, SSL_VERIFY
 
 logger = logging.getLogger(__name__)
 
+# Máximo de descargas simultáneas
+MAX_DOWNLOAD_WORKERS = 8
+
+def _list_directories(directories: Iterable[str]) -> Dict[str, Set[str]]:
+    """
+    Lista los nombres de archivo de cada directorio con una sola pasada de os.scandir.
+    
+    Args:
+        directories: Directorios a listar (se ignoran los repetidos)
+        
+    Returns:
+        Diccionario directorio -> nombres de los archivos que contiene
+        (vacío si el directorio no existe)
+    """
+    listing = {}
+    for directory in directories:
+        if directory in listing:
+            continue
+        try:
+            with os.scandir(directory or ".") as entries:
+                listing[directory] = {entry.name for entry in entries}
+        except FileNotFoundError:
+            listing[directory] = set()
+    return listing
+
+
 class ShaclUpdater:
     """Clase para gestionar la actualización de archivos SHACL desde URLs remotas."""
     
@@ -25,6 +54,11 @@ class ShaclUpdater:
         """
         self.config = update_config or SHACL_UPDATE_CONFIG
         self.last_check_file = os.path.join(SHACL_DIR, ".last_update_check")
+        # Sesión compartida entre hilos: reutiliza conexiones y handshakes TLS con el mismo host
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=MAX_DOWNLOAD_WORKERS)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self._ensure_directories_exist()
         
     def _ensure_directories_exist(self) -> None:
@@ -45,14 +79,12 @@ class ShaclUpdater:
             return True
             
         try:
-            if not os.path.exists(self.last_check_file):
-                return True
-                
-            with open(self.last_check_file, 'r') as f:
-                last_check = datetime.fromisoformat(f.read().strip())
-                
-            interval = timedelta(days=self.config.get("update_interval_days", 7))
-            return datetime.now() > (last_check + interval)
+            # La fecha de modificación del archivo es la de la última verificación: basta un stat
+            last_check = os.stat(self.last_check_file).st_mtime
+            interval = self.config.get("update_interval_days", 7) * 86400.0
+            return time.time() - last_check > interval
+        except FileNotFoundError:
+            return True
         except Exception as e:
             logger.warning(f"Error checking last update timestamp: {e}")
             return True
@@ -60,38 +92,121 @@ class ShaclUpdater:
     def _update_last_check_timestamp(self) -> None:
         """Actualiza el timestamp de la última verificación."""
         try:
-            with open(self.last_check_file, 'w') as f:
-                f.write(datetime.now().isoformat())
+            Path(self.last_check_file).touch()
         except Exception as e:
             logger.error(f"Error updating last check timestamp: {e}")
     
-    def download_file(self, url: str, local_path: str) -> bool:
+    @staticmethod
+    def _validators_path(local_path: str) -> str:
+        """Ruta del archivo con el ETag/Last-Modified de la última descarga."""
+        return f"{local_path}.etag"
+    
+    def _load_validators(self, local_path: str) -> Dict[str, str]:
+        """
+        Lee el ETag, Last-Modified y Content-Length guardados para un archivo.
+        
+        Returns:
+            Diccionario (posiblemente vacío) con las claves "etag", "last_modified"
+            y "content_length"
+        """
+        try:
+            with open(self._validators_path(local_path), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_validators(self, local_path: str, headers) -> None:
+        """Guarda el ETag, Last-Modified y Content-Length de la respuesta junto al archivo descargado."""
+        validators = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "content_length": headers.get("Content-Length"),
+        }
+        try:
+            with open(self._validators_path(local_path), 'w') as f:
+                json.dump({k: v for k, v in validators.items() if v}, f)
+        except OSError as e:
+            logger.warning(f"Error saving cache validators for {local_path}: {e}")
+    
+    @staticmethod
+    def _matches_validators(headers, validators: Dict[str, str]) -> bool:
+        """
+        Comprueba si una respuesta 200 corresponde a la versión ya descargada.
+        
+        Args:
+            headers: Cabeceras de la respuesta
+            validators: Validadores guardados en la descarga anterior
+            
+        Returns:
+            True si coinciden el ETag y el Content-Length
+        """
+        etag = validators.get("etag")
+        content_length = validators.get("content_length")
+        return bool(
+            etag and content_length
+            and headers.get("ETag") == etag
+            and headers.get("Content-Length") == content_length
+        )
+    
+    def download_file(self, url: str, local_path: str, conditional: bool = False) -> bool:
         """
         Descarga un archivo desde una URL remota.
         
         Args:
             url: URL del archivo a descargar
             local_path: Ruta local donde guardar el archivo
+            conditional: Si se envía If-None-Match/If-Modified-Since con los
+                validadores de la descarga anterior, para que el servidor
+                responda 304 si el archivo no ha cambiado
             
         Returns:
-            True si la descarga fue exitosa, False en caso contrario
+            True si se descargó una versión nueva, False en caso contrario
         """
+        headers = {}
+        validators = {}
+        if conditional and os.path.exists(local_path):
+            validators = self._load_validators(local_path)
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        
         try:
             logger.info(f"Downloading SHACL file from {url}")
-            response = requests.get(
+            with self._session.get(
                 url, 
+                headers=headers,
                 timeout=self.config.get("timeout", 30),
-                verify=SSL_VERIFY
-            )
+                verify=SSL_VERIFY,
+                stream=True
+            ) as response:
+                if response.status_code == 304:
+                    logger.info(f"SHACL file not modified: {url}")
+                    return False
+                if response.status_code != 200:
+                    logger.warning(f"Failed to download {url}: HTTP {response.status_code}")
+                    return False
+                if self._matches_validators(response.headers, validators):
+                    # El servidor ignora las cabeceras condicionales pero el archivo es el mismo:
+                    # se cierra la respuesta sin leer el cuerpo
+                    logger.info(f"SHACL file unchanged (same ETag and size): {url}")
+                    return False
+                
+                # Volcar el cuerpo a disco por bloques, sin cargarlo entero en memoria.
+                # Se escribe en un temporal para no dejar un archivo a medias si falla la descarga
+                tmp_path = f"{local_path}.part"
+                response.raw.decode_content = True
+                try:
+                    with open(tmp_path, 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, length=65536)
+                    os.replace(tmp_path, local_path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                self._save_validators(local_path, response.headers)
             
-            if response.status_code == 200:
-                with open(local_path, 'wb') as f:
-                    f.write(response.content)
-                logger.info(f"Successfully downloaded {url} to {local_path}")
-                return True
-            else:
-                logger.warning(f"Failed to download {url}: HTTP {response.status_code}")
-                return False
+            logger.info(f"Successfully downloaded {url} to {local_path}")
+            return True
                 
         except Exception as e:
             logger.error(f"Error downloading {url}: {e}")
@@ -111,14 +226,26 @@ class ShaclUpdater:
             logger.info("Skipping SHACL update check based on update interval")
             return (0, len(SHACL_REMOTE_URLS))
             
-        updated_count = 0
         total_files = len(SHACL_REMOTE_URLS)
         
+        # Si el archivo no existe o se fuerza la actualización, descargarlo entero.
+        # Los archivos ya descargados con ETag/Last-Modified se revalidan con un GET
+        # condicional: el servidor responde 304 sin cuerpo si no han cambiado
+        existing = _list_directories(os.path.dirname(path) for path in SHACL_REMOTE_URLS)
+        tasks = []
         for local_path, url in SHACL_REMOTE_URLS.items():
-            # Si el archivo no existe o se fuerza la actualización, descargarlo
-            if force or not os.path.exists(local_path):
-                if self.download_file(url, local_path):
-                    updated_count += 1
+            directory, name = os.path.split(local_path)
+            names = existing[directory]
+            if force or name not in names:
+                tasks.append((url, local_path, False))
+            elif os.path.basename(self._validators_path(local_path)) in names:
+                tasks.append((url, local_path, True))
+        
+        updated_count = 0
+        if tasks:
+            # Descargas limitadas por red: los hilos liberan el GIL mientras esperan al socket
+            with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(tasks))) as executor:
+                updated_count = sum(executor.map(lambda task: self.download_file(*task), tasks))
         
         # Actualizar timestamp de última verificación
         self._update_last_check_timestamp()
@@ -67,11 +67,11 @@ def test_validate_url(mock_insert_report, mock_validate_metadata_quality):
     mock_validate_metadata_quality.assert_called_once_with("https://example.com/catalog.ttl")
     mock_insert_report.assert_called_once()
 
-@patch("src.api.main.repo.get_latest_report")
-def test_get_latest_report(mock_get_latest_report):
+@patch("src.api.main.repo.get_latest")
+def test_get_latest_report(mock_get_latest):
     """Test the get_latest_report endpoint."""
     # Mock the repository function
-    mock_get_latest_report.return_value = SAMPLE_REPORT
+    mock_get_latest.return_value = (1, SAMPLE_REPORT)
     
     # URL-encode the test URL
     encoded_url = "https%3A%2F%2Fexample.com%2Fcatalog.ttl"
@@ -83,15 +83,44 @@ def test_get_latest_report(mock_get_latest_report):
     assert response.status_code == 200
     assert response.json()["source"] == "https://example.com/catalog.ttl"
     assert response.json()["totalScore"] == 280
+    assert response.headers["ETag"] == '"1"'
     
     # Verify mock was called with correct parameter
-    mock_get_latest_report.assert_called_once_with("https://example.com/catalog.ttl")
+    mock_get_latest.assert_called_once_with("https://example.com/catalog.ttl")
 
-@patch("src.api.main.repo.get_latest_report")
-def test_get_latest_report_not_found(mock_get_latest_report):
+@patch("src.api.main.repo.get_latest")
+def test_get_latest_report_not_modified(mock_get_latest):
+    """Test conditional requests to the get_latest_report endpoint."""
+    mock_get_latest.return_value = (7, SAMPLE_REPORT)
+    encoded_url = "https%3A%2F%2Fexample.com%2Fcatalog.ttl"
+    
+    # The ETag of the returned report gives a 304 without body
+    response = client.get(f"/report/{encoded_url}", headers={"If-None-Match": '"7"'})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"7"'
+    assert response.content == b""
+    
+    # JSON-LD has its own ETag, so the JSON one does not match it (format is case-insensitive)
+    response = client.get(f"/report/{encoded_url}?format=JSONLD", headers={"If-None-Match": '"7"'})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"7-jsonld"'
+    
+    # Unknown formats are rejected
+    response = client.get(f"/report/{encoded_url}?format=xml")
+    assert response.status_code == 422
+    
+    # A newer report changes the ETag
+    mock_get_latest.return_value = (8, SAMPLE_REPORT)
+    response = client.get(f"/report/{encoded_url}", headers={"If-None-Match": '"7"'})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"8"'
+    assert response.json()["source"] == "https://example.com/catalog.ttl"
+
+@patch("src.api.main.repo.get_latest")
+def test_get_latest_report_not_found(mock_get_latest):
     """Test the get_latest_report endpoint when no report is found."""
     # Mock the repository function to return None (no report found)
-    mock_get_latest_report.return_value = None
+    mock_get_latest.return_value = None
     
     # URL-encode the test URL
     encoded_url = "https%3A%2F%2Fexample.com%2Fcatalog.ttl"
@@ -105,13 +134,15 @@ def test_get_latest_report_not_found(mock_get_latest_report):
     assert "No report found" in response.json()["detail"]
     
     # Verify mock was called with correct parameter
-    mock_get_latest_report.assert_called_once_with("https://example.com/catalog.ttl")
+    mock_get_latest.assert_called_once_with("https://example.com/catalog.ttl")
 
+@patch("src.api.main.repo.get_latest_id")
 @patch("src.api.main.repo.get_history")
-def test_get_history(mock_get_history):
+def test_get_history(mock_get_history, mock_get_latest_id):
     """Test the get_history endpoint."""
-    # Mock the repository function
+    # Mock the repository functions
     mock_get_history.return_value = [SAMPLE_REPORT]
+    mock_get_latest_id.return_value = 3
     
     # URL-encode the test URL
     encoded_url = "https%3A%2F%2Fexample.com%2Fcatalog.ttl"
@@ -123,10 +154,24 @@ def test_get_history(mock_get_history):
     assert response.status_code == 200
     assert len(response.json()) == 1
     assert response.json()[0]["source"] == "https://example.com/catalog.ttl"
+    assert response.headers["ETag"] == '"history-3"'
     
     # Verify mock was called with correct parameter
     mock_get_history.assert_called_once_with("https://example.com/catalog.ttl")
 
+@patch("src.api.main.repo.get_latest_id")
+@patch("src.api.main.repo.get_history")
+def test_get_history_not_modified(mock_get_history, mock_get_latest_id):
+    """Test that an unchanged history answers a conditional request with 304."""
+    mock_get_latest_id.return_value = 3
+    
+    response = client.get("/history/https%3A%2F%2Fexample.com%2Fcatalog.ttl", headers={"If-None-Match": '"history-3"'})
+    
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"history-3"'
+    # The reports are not read at all
+    mock_get_history.assert_not_called()
+
 @patch("src.api.main.repo.get_reports_by_date_range")
 def test_get_reports_by_date_range(mock_get_reports_by_date_range):
     """Test the get_reports_by_date_range endpoint."""
@@ -159,4 +204,23 @@ def test_get_reports_by_rating(mock_get_reports_by_rating):
     assert response.json()[0]["source"] == "https://example.com/catalog.ttl"
     
     # Verify mock was called with correct parameter
-    mock_get_reports_by_rating.assert_called_once_with("Good")
\ No newline at end of file
+    mock_get_reports_by_rating.assert_called_once_with("Good")
+
+@patch("src.api.main.warm_shapes_cache")
+@patch("src.api.main.clear_shapes_cache")
+@patch("src.api.main.update_shacl_files")
+def test_update_shacl_clears_shapes_cache(mock_update_shacl_files, mock_clear_shapes_cache, mock_warm_shapes_cache):
+    """Test that updated SHACL files replace the cached shapes graphs."""
+    # No file changed: the cached shapes are kept
+    mock_update_shacl_files.return_value = (0, 10)
+    response = client.post("/admin/update-shacl")
+    assert response.status_code == 200
+    mock_clear_shapes_cache.assert_not_called()
+    
+    # Some files changed: the cache is dropped and the shapes parsed again
+    mock_update_shacl_files.return_value = (2, 10)
+    response = client.post("/admin/update-shacl?force=true")
+    assert response.status_code == 200
+    assert response.json()["updated"] == 2
+    mock_clear_shapes_cache.assert_called_once()
+    mock_warm_shapes_cache.assert_called_once()
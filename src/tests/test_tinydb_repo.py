@@ -58,6 +58,32 @@ def test_insert_report(repo):
     assert isinstance(doc_id, int)
     assert doc_id > 0
 
+def test_insert_reports(repo):
+    """Test inserting a batch of reports into the repository."""
+    # Insert two reports in a single call
+    report1 = SAMPLE_REPORT_DATA.copy()
+    report1["created"] = "2025-01-01"
+    report2 = SAMPLE_REPORT_DATA.copy()
+    report2["created"] = "2025-02-01"
+    
+    doc_ids = repo.insert_reports([report1, report2])
+    
+    # Verify both reports were inserted in order
+    assert len(doc_ids) == 2
+    assert doc_ids[0] < doc_ids[1]
+    assert repo.get_latest_report("https://example.com/catalog.ttl")["created"] == "2025-02-01"
+
+def test_insert_reports_invalid(repo):
+    """Test that an invalid report rejects the whole batch."""
+    invalid_report = SAMPLE_REPORT_DATA.copy()
+    invalid_report["created"] = "2025-13-45"
+    
+    with pytest.raises(ValueError):
+        repo.insert_reports([SAMPLE_REPORT_DATA, invalid_report])
+    
+    # Verify nothing was inserted
+    assert repo.get_latest_report("https://example.com/catalog.ttl") is None
+
 def test_get_latest_report(repo):
     """Test retrieving the latest report for a URL."""
     # Insert multiple reports for the same URL with different dates
@@ -76,6 +102,24 @@ def test_get_latest_report(repo):
     assert latest is not None
     assert latest["created"] == "2025-02-01"
 
+def test_get_latest(repo):
+    """Test that the latest report and its ID belong to the same record."""
+    first_report = SAMPLE_REPORT_DATA.copy()
+    first_report["created"] = "2025-02-01"
+    backdated_report = SAMPLE_REPORT_DATA.copy()
+    backdated_report["created"] = "2025-01-01"
+    backdated_report["totalScore"] = 100
+    
+    first_id = repo.insert_report(first_report)
+    repo.insert_report(backdated_report)
+    
+    # The highest ID is the backdated report, but the latest one is the first
+    latest_id, latest = repo.get_latest("https://example.com/catalog.ttl")
+    assert latest_id == first_id
+    assert latest["created"] == "2025-02-01"
+    assert latest["totalScore"] == 280
+    assert repo.get_latest("https://nonexistent.com/catalog.ttl") is None
+
 def test_get_latest_report_not_found(repo):
     """Test retrieving a report for a URL that doesn't exist."""
     # Get a report for a URL that doesn't exist in the database
@@ -107,6 +151,25 @@ def test_get_history(repo):
     assert "2025-01-01" in dates
     assert "2025-02-01" in dates
 
+def test_get_history_iter(repo):
+    """Test paging through the history of reports for a URL."""
+    # Insert three reports for the same URL
+    reports = []
+    for created in ("2025-01-01", "2025-02-01", "2025-03-01"):
+        report = SAMPLE_REPORT_DATA.copy()
+        report["created"] = created
+        reports.append(report)
+    repo.insert_reports(reports)
+    
+    # Get the second page of one report, and everything after the first
+    page = list(repo.get_history_iter("https://example.com/catalog.ttl", limit=1, offset=1))
+    assert [r["created"] for r in page] == ["2025-02-01"]
+    rest = list(repo.get_history_iter("https://example.com/catalog.ttl", offset=1))
+    assert [r["created"] for r in rest] == ["2025-02-01", "2025-03-01"]
+    
+    # Unknown URLs yield nothing
+    assert list(repo.get_history_iter("https://nonexistent.com/catalog.ttl")) == []
+
 def test_get_reports_by_date_range(repo):
     """Test retrieving reports within a date range."""
     # Insert reports with different dates
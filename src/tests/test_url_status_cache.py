@@ -0,0 +1,72 @@
+"""
+Tests for the persistent URL status cache.
+"""
+from src.api import helpers
+from src.api.helpers import URLStatusCache
+
+
+class FakeClock:
+    """Controllable replacement for time.time."""
+    
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_put_many_get_many_round_trip(tmp_path):
+    """Test that stored results are read back, and unknown URLs are left out."""
+    cache = URLStatusCache(str(tmp_path / "cache.sqlite"))
+    
+    cache.put_many({"https://example.com/ok.csv": True, "https://example.com/missing.csv": False})
+    
+    assert cache.get_many(["https://example.com/ok.csv", "https://example.com/missing.csv", "https://example.com/new.csv"]) == {
+        "https://example.com/ok.csv": True,
+        "https://example.com/missing.csv": False,
+    }
+    assert cache.get_many([]) == {}
+
+
+def test_results_expire_after_their_ttl(tmp_path, monkeypatch):
+    """Test that accessible URLs expire after ttl and failures after negative_ttl."""
+    clock = FakeClock()
+    monkeypatch.setattr(helpers.time, "time", clock)
+    cache = URLStatusCache(str(tmp_path / "cache.sqlite"), ttl=100, negative_ttl=10)
+    urls = ["https://example.com/ok.csv", "https://example.com/missing.csv"]
+    cache.put_many({urls[0]: True, urls[1]: False})
+    
+    clock.now += 9
+    assert cache.get_many(urls) == {urls[0]: True, urls[1]: False}
+    
+    # The failure is checked again sooner than the accessible URL
+    clock.now += 2
+    assert cache.get_many(urls) == {urls[0]: True}
+    
+    clock.now += 90
+    assert cache.get_many(urls) == {}
+    
+    # Storing a URL again refreshes it
+    cache.put_many({urls[0]: False})
+    assert cache.get_many(urls) == {urls[0]: False}
+
+
+def test_get_many_above_batch_size(tmp_path):
+    """Test lookups of more URLs than fit in a single SQLite query."""
+    cache = URLStatusCache(str(tmp_path / "cache.sqlite"))
+    count = URLStatusCache._BATCH * 2 + 7
+    results = {f"https://example.com/file/{i}.csv": i % 3 != 0 for i in range(count)}
+    
+    cache.put_many(results)
+    
+    assert cache.get_many(results) == results
+    assert cache.get_many(list(results) + ["https://example.com/other.csv"]) == results
+
+
+def test_unusable_path_degrades_to_empty_cache(tmp_path):
+    """Test that a cache that cannot be opened behaves as empty instead of raising."""
+    cache = URLStatusCache(str(tmp_path / "missing-dir" / "cache.sqlite"))
+    
+    cache.put_many({"https://example.com/ok.csv": True})
+    
+    assert cache.get_many(["https://example.com/ok.csv"]) == {}
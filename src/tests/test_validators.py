@@ -0,0 +1,146 @@
+"""
+Tests for the RDF loading helpers of the validators module.
+"""
+from unittest.mock import patch
+
+import pytest
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.compare import isomorphic
+from rdflib.namespace import DCAT, DCTERMS, RDF, XSD
+
+from src.api import validators
+from src.api.validators import (
+    SHACLComplianceChecker, SHACL_RESULTS_CACHE, clear_shapes_cache, parse_ntriples_fast, parse_turtle_fast
+)
+
+# N-Triples covering escapes, language tags, typed literals, blank nodes and comments
+NTRIPLES = r'''# Catálogo de prueba
+<http://example.com/ds/1> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/ns/dcat#Dataset> .
+<http://example.com/ds/1> <http://purl.org/dc/terms/title> "Datos \"abiertos\"\tcon\\escapes\n" .
+<http://example.com/ds/1> <http://purl.org/dc/terms/title> "Café en espa\U000000F1ol"@es .
+<http://example.com/ds/1> <http://purl.org/dc/terms/title> "Open data"@en-GB .
+<http://example.com/ds/1> <http://www.w3.org/ns/dcat#byteSize> "1024"^^<http://www.w3.org/2001/XMLSchema#decimal> .
+<http://example.com/ds/1> <http://www.w3.org/ns/dcat#distribution> _:dist1 .
+_:dist1 <http://www.w3.org/ns/dcat#accessURL> <http://example.com/file%20name.csv> . # trailing comment
+_:dist1 <http://purl.org/dc/terms/format> _:b2 .
+
+_:b2 <http://www.w3.org/2000/01/rdf-schema#label> "CSV" .
+'''
+
+
+def test_parse_ntriples_fast_matches_rdflib():
+    """Test that the regex N-Triples parser builds the same graph as rdflib."""
+    g = Graph()
+    
+    assert parse_ntriples_fast(NTRIPLES, g) is True
+    
+    expected = Graph().parse(data=NTRIPLES, format="nt")
+    assert len(g) == len(expected) == 9
+    assert isomorphic(g, expected)
+
+
+def test_parse_ntriples_fast_rejects_malformed_line():
+    """Test that a malformed line leaves the graph untouched so rdflib's parser is used."""
+    g = Graph()
+    malformed = NTRIPLES + '<http://example.com/ds/1> <http://purl.org/dc/terms/title> "missing dot"\n'
+    
+    assert parse_ntriples_fast(malformed, g) is False
+    assert len(g) == 0
+
+
+TURTLE = """@prefix dcat: <http://www.w3.org/ns/dcat#> .
+@prefix dct: <http://purl.org/dc/terms/> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+<http://example.com/ds/1> a dcat:Dataset ;
+    dct:title "Datos abiertos", "Open data"@en ;
+    dcat:keyword "transporte" ;
+    dcat:byteSize 1024 ;
+    dct:issued "2025-01-01"^^xsd:date ;
+    dcat:distribution [
+        a dcat:Distribution ;
+        dcat:accessURL <http://example.com/file.csv>
+    ] .
+"""
+
+
+def test_parse_turtle_fast_matches_rdflib():
+    """Test that the pyoxigraph Turtle parser builds the same graph as rdflib."""
+    pytest.importorskip("pyoxigraph", minversion="0.4")
+    g = Graph()
+    
+    assert parse_turtle_fast(TURTLE.encode("utf-8"), g) is True
+    
+    expected = Graph().parse(data=TURTLE, format="turtle")
+    assert len(g) == len(expected) == 9
+    assert isomorphic(g, expected)
+    
+    # Plain and language-tagged literals stay untyped, as rdflib parses them
+    dataset = URIRef("http://example.com/ds/1")
+    titles = set(g.objects(dataset, DCTERMS.title))
+    assert titles == {Literal("Datos abiertos"), Literal("Open data", lang="en")}
+    assert all(title.datatype is None for title in titles)
+    assert g.value(dataset, DCTERMS.issued) == Literal("2025-01-01", datatype=XSD.date)
+    
+    # The document prefixes are bound on the graph
+    assert dict(g.namespaces())["dcat"] == URIRef("http://www.w3.org/ns/dcat#")
+
+
+def test_parse_turtle_fast_falls_back_on_relative_iris():
+    """Test that a document pyoxigraph rejects leaves the graph untouched so rdflib's parser is used."""
+    pytest.importorskip("pyoxigraph", minversion="0.4")
+    g = Graph()
+    
+    assert parse_turtle_fast(b"<dataset> <title> \"Datos\" .", g) is False
+    assert parse_turtle_fast(b"<http://example.com/a> <http://example.com/b> .", g) is False
+    assert len(g) == 0
+
+
+SHAPES = """@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix dcat: <http://www.w3.org/ns/dcat#> .
+@prefix dct: <http://purl.org/dc/terms/> .
+
+<http://example.com/shapes/Dataset> a sh:NodeShape ;
+    sh:targetClass dcat:Dataset ;
+    sh:property [ sh:path dct:title ; sh:minCount 1 ] .
+"""
+
+
+def _dataset_graph(with_blank_node: bool = False) -> Graph:
+    """Build a small dataset graph, optionally with a blank node contact point."""
+    g = Graph()
+    dataset = URIRef("http://example.com/ds/1")
+    g.add((dataset, RDF.type, DCAT.Dataset))
+    g.add((dataset, DCTERMS.title, Literal("Datos abiertos")))
+    if with_blank_node:
+        g.add((dataset, DCAT.contactPoint, BNode()))
+    return g
+
+
+def test_shacl_results_cache(tmp_path):
+    """Test that repeated IRI-only graphs reuse the SHACL result until the shapes are cleared."""
+    shapes_file = tmp_path / "shapes.ttl"
+    shapes_file.write_text(SHAPES, encoding="utf-8")
+    checker = SHACLComplianceChecker([shapes_file], auto_update=False, backend="pyshacl")
+    clear_shapes_cache()
+    
+    with patch("src.api.validators.validate", wraps=validators.validate) as mock_validate:
+        # Same content parsed twice: the second check is answered from the cache
+        assert checker.check(_dataset_graph(), [], {}) == (1, 1)
+        assert checker.check(_dataset_graph(), [], {}) == (1, 1)
+        assert mock_validate.call_count == 1
+        
+        # Clearing the shapes drops the results that depend on them
+        clear_shapes_cache()
+        assert len(SHACL_RESULTS_CACHE) == 0
+        assert checker.check(_dataset_graph(), [], {}) == (1, 1)
+        assert mock_validate.call_count == 2
+        
+        # Graphs with blank nodes are neither hashed nor cached
+        cached = len(SHACL_RESULTS_CACHE)
+        assert checker.check(_dataset_graph(with_blank_node=True), [], {}) == (1, 1)
+        assert checker.check(_dataset_graph(with_blank_node=True), [], {}) == (1, 1)
+        assert mock_validate.call_count == 4
+        assert len(SHACL_RESULTS_CACHE) == cached
+    
+    clear_shapes_cache()
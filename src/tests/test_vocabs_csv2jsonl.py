@@ -0,0 +1,55 @@
+"""
+Tests for the vocabulary CSV to JSONL/Feather conversion script.
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "vocabs_csv2jsonl.py"
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    """Load the conversion script as a module, with its root in a temporary directory."""
+    spec = importlib.util.spec_from_file_location("vocabs_csv2jsonl", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "ROOT", tmp_path)
+    return module
+
+
+@pytest.mark.parametrize("name, csv_text, expected", [
+    (
+        "non_proprietary",
+        "uri,label,equivalent_uri\n"
+        "http://example.com/fmt/CSV,CSV,\n"
+        "http://example.com/fmt/ODS,ODS,http://example.com/other/ODS\n",
+        [
+            {"uri": "http://example.com/fmt/CSV", "label": "CSV", "equivalentUri": None},
+            {"uri": "http://example.com/fmt/ODS", "label": "ODS", "equivalentUri": "http://example.com/other/ODS"},
+        ],
+    ),
+    (
+        "licenses",
+        "http://example.com/licence/A,A\n"
+        "http://example.com/licence/B,B,http://example.com/legal/B\n",
+        [
+            {"uri": "http://example.com/licence/A", "code": "A", "url": None, "label": "A"},
+            {"uri": "http://example.com/licence/B", "code": "B", "url": "http://example.com/legal/B", "label": "B"},
+        ],
+    ),
+])
+def test_feather_keeps_optional_columns(converter, tmp_path, name, csv_text, expected):
+    """Test that optional fields missing from the first rows are kept in the Feather file."""
+    feather = pytest.importorskip("pyarrow.feather")
+    csv_path = tmp_path / f"{name}.csv"
+    csv_path.write_text(csv_text, encoding="utf-8")
+    feather_path = tmp_path / f"{name}.feather"
+    
+    count = converter.convert_to_jsonl(name, csv_path, tmp_path / f"{name}.jsonl", feather_path)
+    
+    table = feather.read_table(feather_path)
+    assert count == len(expected)
+    assert table.schema == converter.feather_schema(converter.VOCABS[name]["type"])
+    assert table.to_pylist() == expected